@@ -115,6 +115,26 @@ class RunDatabaseAdapter(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def read_turn_metadata_for_run(self, run_id: str) -> list[TurnMetadata]:
+        """Read turn metadata for every turn of a run.
+
+        Args:
+            run_id: The ID of the run
+
+        Returns:
+            List of TurnMetadata ordered by turn_number. Returns empty list if
+            the run has no turn metadata.
+
+        Raises:
+            ValueError: If the turn metadata data is invalid (NULL fields, invalid action types)
+            KeyError: If required columns are missing from the database row
+            Exception: Database-specific exception if the operation fails.
+                      Implementations should document the specific exception types
+                      they raise.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def write_turn_metadata(self, turn_metadata: TurnMetadata) -> None:
         """Write turn metadata to the database.
@@ -155,6 +175,20 @@ class ProfileDatabaseAdapter(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def write_profiles(self, profiles: list[BlueskyProfile]) -> None:
+        """Write multiple profiles to the database (batch operation).
+
+        Args:
+            profiles: List of BlueskyProfile models to write
+
+        Raises:
+            Exception: Database-specific exception if constraints are violated or
+                      the operation fails. Implementations should document the
+                      specific exception types they raise.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def read_profile(self, handle: str) -> Optional[BlueskyProfile]:
         """Read a profile by handle.
@@ -174,6 +208,25 @@ class ProfileDatabaseAdapter(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def read_profiles_by_handles(self, handles: Iterable[str]) -> list[BlueskyProfile]:
+        """Read profiles for a collection of handles in one operation.
+
+        Args:
+            handles: Iterable of profile handles to look up
+
+        Returns:
+            List of BlueskyProfile models in the order of `handles`. Handles
+            with no stored profile are skipped.
+
+        Raises:
+            ValueError: If any profile data is invalid (NULL fields)
+            Exception: Database-specific exception if the operation fails.
+                      Implementations should document the specific exception types
+                      they raise.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def read_all_profiles(self) -> list[BlueskyProfile]:
         """Read all profiles.
@@ -282,6 +335,28 @@ class FeedPostDatabaseAdapter(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def read_feed_posts_page(
+        self, limit: int, offset: int = 0
+    ) -> list[BlueskyFeedPost]:
+        """Read one page of feed posts in a stable order.
+
+        Args:
+            limit: Maximum number of posts to return
+            offset: Number of posts to skip
+
+        Returns:
+            Up to `limit` BlueskyFeedPost models. Returns empty list past the end.
+
+        Raises:
+            ValueError: If limit or offset is negative, or any feed post data is
+                invalid (NULL fields)
+            Exception: Database-specific exception if the operation fails.
+                      Implementations should document the specific exception types
+                      they raise.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def read_feed_posts_by_uris(self, uris: Iterable[str]) -> list[BlueskyFeedPost]:
         """Read feed posts by URIs.
@@ -432,6 +507,20 @@ class GeneratedBioDatabaseAdapter(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def write_generated_bios(self, bios: list[GeneratedBio]) -> None:
+        """Write multiple generated bios to the database (batch operation).
+
+        Args:
+            bios: List of GeneratedBio models to write
+
+        Raises:
+            Exception: Database-specific exception if constraints are violated or
+                      the operation fails. Implementations should document the
+                      specific exception types they raise.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def read_generated_bio(self, handle: str) -> Optional[GeneratedBio]:
         """Read a generated bio by handle.
@@ -2,8 +2,13 @@
 
 from typing import Iterable
 
+from db import db as sqlite_db
 from db.adapters.base import FeedPostDatabaseAdapter
-from db.db import _validate_feed_post_row, get_connection
+from db.db import (
+    _SELECT_FEED_POSTS,
+    _row_to_feed_post,
+    get_connection,
+)
 from simulation.core.models.posts import BlueskyFeedPost
 
 
@@ -26,9 +31,7 @@ class SQLiteFeedPostAdapter(FeedPostDatabaseAdapter):
             sqlite3.IntegrityError: If uri violates constraints
             sqlite3.OperationalError: If database operation fails
         """
-        from db.db import write_feed_post
-
-        write_feed_post(post)
+        sqlite_db.write_feed_post(post)
 
     def write_feed_posts(self, posts: list[BlueskyFeedPost]) -> None:
         """Write multiple feed posts to SQLite (batch operation).
@@ -40,9 +43,7 @@ class SQLiteFeedPostAdapter(FeedPostDatabaseAdapter):
             sqlite3.IntegrityError: If any uri violates constraints
             sqlite3.OperationalError: If database operation fails
         """
-        from db.db import write_feed_posts
-
-        write_feed_posts(posts)
+        sqlite_db.write_feed_posts(posts)
 
     def read_feed_post(self, uri: str) -> BlueskyFeedPost:
         """Read a feed post from SQLite.
@@ -57,11 +58,8 @@ class SQLiteFeedPostAdapter(FeedPostDatabaseAdapter):
             ValueError: If uri is empty or if no feed post is found for the given URI
             ValueError: If the feed post data is invalid (NULL fields)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from the database row
         """
-        from db.db import read_feed_post
-
-        return read_feed_post(uri)
+        return sqlite_db.read_feed_post(uri)
 
     def read_feed_posts_by_author(self, author_handle: str) -> list[BlueskyFeedPost]:
         """Read all feed posts by a specific author from SQLite.
@@ -75,11 +73,8 @@ class SQLiteFeedPostAdapter(FeedPostDatabaseAdapter):
         Raises:
             ValueError: If any feed post data is invalid (NULL fields)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from any database row
         """
-        from db.db import read_feed_posts_by_author
-
-        return read_feed_posts_by_author(author_handle)
+        return sqlite_db.read_feed_posts_by_author(author_handle)
 
     def read_all_feed_posts(self) -> list[BlueskyFeedPost]:
         """Read all feed posts from SQLite.
@@ -90,11 +85,27 @@ class SQLiteFeedPostAdapter(FeedPostDatabaseAdapter):
         Raises:
             ValueError: If any feed post data is invalid (NULL fields)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from any database row
         """
-        from db.db import read_all_feed_posts
+        return sqlite_db.read_all_feed_posts()
 
-        return read_all_feed_posts()
+    def read_feed_posts_page(
+        self, limit: int, offset: int = 0
+    ) -> list[BlueskyFeedPost]:
+        """Read one page of feed posts from SQLite, ordered by URI.
+
+        Args:
+            limit: Maximum number of posts to return
+            offset: Number of posts to skip
+
+        Returns:
+            Up to `limit` BlueskyFeedPost models. Returns empty list past the end.
+
+        Raises:
+            ValueError: If limit or offset is negative, or any feed post data is
+                invalid (NULL fields)
+            sqlite3.OperationalError: If database operation fails
+        """
+        return sqlite_db.read_feed_posts_page(limit, offset)
 
     def read_feed_posts_by_uris(self, uris: Iterable[str]) -> list[BlueskyFeedPost]:
         """Read feed posts by URIs.
@@ -109,44 +120,20 @@ class SQLiteFeedPostAdapter(FeedPostDatabaseAdapter):
 
         Raises:
             ValueError: If the feed post data is invalid (NULL fields)
-            KeyError: If required columns are missing from the database row
             sqlite3.OperationalError: If database operation fails
         """
-        with get_connection() as conn:
-            if not uris:
-                rows = []
-            else:
-                q_marks = ",".join("?" for _ in uris)
-                sql = f"SELECT * FROM bluesky_feed_posts WHERE uri IN ({q_marks})"
-                result_rows = conn.execute(sql, tuple(uris)).fetchall()
-                # Validate all returned rows before filtering (catches data integrity issues)
-                for row in result_rows:
-                    uri_value = row["uri"] if row["uri"] is not None else "unknown"
-                    context = f"feed posts for uri={uri_value}"
-                    _validate_feed_post_row(row, context=context)
-                # Re-map rows by uri and restore input order
-                row_by_uri = {row["uri"]: row for row in result_rows}
-                rows = [row_by_uri[uri] for uri in uris if uri in row_by_uri]
-
-            if len(rows) == 0:
-                return []
-
-            posts = []
-            for row in rows:
-                posts.append(
-                    BlueskyFeedPost(
-                        id=row["uri"],
-                        uri=row["uri"],
-                        author_display_name=row["author_display_name"],
-                        author_handle=row["author_handle"],
-                        text=row["text"],
-                        bookmark_count=row["bookmark_count"],
-                        like_count=row["like_count"],
-                        quote_count=row["quote_count"],
-                        reply_count=row["reply_count"],
-                        repost_count=row["repost_count"],
-                        created_at=row["created_at"],
-                    )
-                )
-
-            return posts
+        if not uris:
+            return []
+
+        q_marks = ",".join("?" for _ in uris)
+        sql = f"{_SELECT_FEED_POSTS} WHERE uri IN ({q_marks})"
+        cursor = get_connection().execute(sql, tuple(uris))
+        result_rows = cursor.fetchall()
+
+        # Validate and build each post in a single pass over the rows,
+        # keyed by uri so input order can be restored afterwards.
+        post_by_uri: dict[str, BlueskyFeedPost] = {}
+        for row in result_rows:
+            post_by_uri[row[0]] = _row_to_feed_post(row)
+
+        return [post_by_uri[uri] for uri in uris if uri in post_by_uri]
@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+from db import db as sqlite_db
 from db.adapters.base import GeneratedBioDatabaseAdapter
 from simulation.core.models.generated.bio import GeneratedBio
 
@@ -25,12 +26,22 @@ class SQLiteGeneratedBioAdapter(GeneratedBioDatabaseAdapter):
             sqlite3.IntegrityError: If handle violates constraints
             sqlite3.OperationalError: If database operation fails
         """
-        from db.db import write_generated_bio_to_database
-
-        write_generated_bio_to_database(
+        sqlite_db.write_generated_bio_to_database(
             bio.handle, bio.generated_bio, bio.metadata.created_at
         )
 
+    def write_generated_bios(self, bios: list[GeneratedBio]) -> None:
+        """Write multiple generated bios to SQLite (batch operation).
+
+        Args:
+            bios: List of GeneratedBio models to write
+
+        Raises:
+            sqlite3.IntegrityError: If any handle violates constraints
+            sqlite3.OperationalError: If database operation fails
+        """
+        sqlite_db.write_generated_bios(bios)
+
     def read_generated_bio(self, handle: str) -> Optional[GeneratedBio]:
         """Read a generated bio from SQLite.
 
@@ -43,11 +54,8 @@ class SQLiteGeneratedBioAdapter(GeneratedBioDatabaseAdapter):
         Raises:
             ValueError: If the bio data is invalid (NULL fields)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from the database row
         """
-        from db.db import read_generated_bio
-
-        return read_generated_bio(handle)
+        return sqlite_db.read_generated_bio(handle)
 
     def read_all_generated_bios(self) -> list[GeneratedBio]:
         """Read all generated bios from SQLite.
@@ -58,8 +66,5 @@ class SQLiteGeneratedBioAdapter(GeneratedBioDatabaseAdapter):
         Raises:
             ValueError: If any bio data is invalid (NULL fields)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from any database row
         """
-        from db.db import read_all_generated_bios
-
-        return read_all_generated_bios()
+        return sqlite_db.read_all_generated_bios()
@@ -1,11 +1,18 @@
 """SQLite implementation of generated feed database adapter."""
 
-import json
-
+from db import db as sqlite_db
 from db.adapters.base import GeneratedFeedDatabaseAdapter
-from db.db import _validate_generated_feed_row, get_connection
+from db.db import (
+    _SELECT_GENERATED_FEEDS,
+    _row_to_generated_feed,
+    get_connection,
+)
 from simulation.core.models.feeds import GeneratedFeed
 
+_SELECT_FEEDS_FOR_TURN_SQL = (
+    f"{_SELECT_GENERATED_FEEDS} WHERE run_id = ? AND turn_number = ?"
+)
+
 
 class SQLiteGeneratedFeedAdapter(GeneratedFeedDatabaseAdapter):
     """SQLite implementation of GeneratedFeedDatabaseAdapter.
@@ -26,9 +33,19 @@ class SQLiteGeneratedFeedAdapter(GeneratedFeedDatabaseAdapter):
             sqlite3.IntegrityError: If composite key violates constraints
             sqlite3.OperationalError: If database operation fails
         """
-        from db.db import write_generated_feed
+        sqlite_db.write_generated_feed(feed)
+
+    def write_generated_feeds(self, feeds: list[GeneratedFeed]) -> None:
+        """Write multiple generated feeds to SQLite (batch operation).
 
-        write_generated_feed(feed)
+        Args:
+            feeds: List of GeneratedFeed models to write
+
+        Raises:
+            sqlite3.IntegrityError: If any composite key violates constraints
+            sqlite3.OperationalError: If database operation fails
+        """
+        sqlite_db.write_generated_feeds(feeds)
 
     def read_generated_feed(
         self, agent_handle: str, run_id: str, turn_number: int
@@ -47,11 +64,8 @@ class SQLiteGeneratedFeedAdapter(GeneratedFeedDatabaseAdapter):
             ValueError: If no feed is found for the given composite key
             ValueError: If the feed data is invalid (NULL fields)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from the database row
         """
-        from db.db import read_generated_feed
-
-        return read_generated_feed(agent_handle, run_id, turn_number)
+        return sqlite_db.read_generated_feed(agent_handle, run_id, turn_number)
 
     def read_all_generated_feeds(self) -> list[GeneratedFeed]:
         """Read all generated feeds from SQLite.
@@ -62,11 +76,8 @@ class SQLiteGeneratedFeedAdapter(GeneratedFeedDatabaseAdapter):
         Raises:
             ValueError: If any feed data is invalid (NULL fields)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from any database row
         """
-        from db.db import read_all_generated_feeds
-
-        return read_all_generated_feeds()
+        return sqlite_db.read_all_generated_feeds()
 
     def read_post_uris_for_run(self, agent_handle: str, run_id: str) -> set[str]:
         """Read all post URIs from generated feeds for a specific agent and run.
@@ -83,9 +94,7 @@ class SQLiteGeneratedFeedAdapter(GeneratedFeedDatabaseAdapter):
             ValueError: If agent_handle or run_id is empty
             sqlite3.OperationalError: If database operation fails
         """
-        from db.db import read_post_uris_for_run
-
-        return read_post_uris_for_run(agent_handle, run_id)
+        return sqlite_db.read_post_uris_for_run(agent_handle, run_id)
 
     def read_feeds_for_turn(self, run_id: str, turn_number: int) -> list[GeneratedFeed]:
         """Read all generated feeds for a specific run and turn.
@@ -99,35 +108,15 @@ class SQLiteGeneratedFeedAdapter(GeneratedFeedDatabaseAdapter):
             Returns empty list if no feeds found.
 
         Raises:
-            ValueError: If the feed data is invalid (NULL fields, invalid JSON)
-            KeyError: If required columns are missing from the database row
+            ValueError: If the feed data is invalid (NULL fields, invalid JSON,
+                unexpected column count)
             sqlite3.OperationalError: If database operation fails
         """
-        with get_connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM generated_feeds WHERE run_id = ? AND turn_number = ?",
-                (run_id, turn_number),
-            ).fetchall()
-
-            if len(rows) == 0:
-                return []
-
-            # Build context string once (run_id and turn_number don't change in loop)
-            context = f"generated feed for run {run_id}, turn {turn_number}"
-            feeds = []
-            for row in rows:
-                # Validate required fields are not NULL
-                _validate_generated_feed_row(row, context=context)
-
-                # add validated rows to feeds list
-                feeds.append(
-                    GeneratedFeed(
-                        feed_id=row["feed_id"],
-                        run_id=row["run_id"],
-                        turn_number=row["turn_number"],
-                        agent_handle=row["agent_handle"],
-                        post_uris=json.loads(row["post_uris"]),
-                        created_at=row["created_at"],
-                    )
-                )
-            return feeds
+        cursor = get_connection().execute(
+            _SELECT_FEEDS_FOR_TURN_SQL, (run_id, turn_number)
+        )
+
+        # Iterate the cursor directly rather than fetchall() so rows are
+        # validated and converted in a single pass without materializing
+        # an intermediate list of rows.
+        return [_row_to_generated_feed(row) for row in cursor]
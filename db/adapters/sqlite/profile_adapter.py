@@ -1,7 +1,8 @@
 """SQLite implementation of profile database adapter."""
 
-from typing import Optional
+from typing import Iterable, Optional
 
+from db import db as sqlite_db
 from db.adapters.base import ProfileDatabaseAdapter
 from simulation.core.models.profiles import BlueskyProfile
 
@@ -25,9 +26,19 @@ class SQLiteProfileAdapter(ProfileDatabaseAdapter):
             sqlite3.IntegrityError: If handle violates constraints
             sqlite3.OperationalError: If database operation fails
         """
-        from db.db import write_profile
+        sqlite_db.write_profile(profile)
 
-        write_profile(profile)
+    def write_profiles(self, profiles: list[BlueskyProfile]) -> None:
+        """Write multiple profiles to SQLite (batch operation).
+
+        Args:
+            profiles: List of BlueskyProfile models to write
+
+        Raises:
+            sqlite3.IntegrityError: If any handle violates constraints
+            sqlite3.OperationalError: If database operation fails
+        """
+        sqlite_db.write_profiles(profiles)
 
     def read_profile(self, handle: str) -> Optional[BlueskyProfile]:
         """Read a profile from SQLite.
@@ -41,11 +52,24 @@ class SQLiteProfileAdapter(ProfileDatabaseAdapter):
         Raises:
             ValueError: If the profile data is invalid (NULL fields)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from the database row
         """
-        from db.db import read_profile
+        return sqlite_db.read_profile(handle)
+
+    def read_profiles_by_handles(self, handles: Iterable[str]) -> list[BlueskyProfile]:
+        """Read profiles for a collection of handles from SQLite.
+
+        Args:
+            handles: Iterable of profile handles to look up
+
+        Returns:
+            List of BlueskyProfile models in the order of `handles`. Handles
+            with no stored profile are skipped.
 
-        return read_profile(handle)
+        Raises:
+            ValueError: If any profile data is invalid (NULL fields)
+            sqlite3.OperationalError: If database operation fails
+        """
+        return sqlite_db.read_profiles_by_handles(handles)
 
     def read_all_profiles(self) -> list[BlueskyProfile]:
         """Read all profiles from SQLite.
@@ -56,8 +80,5 @@ class SQLiteProfileAdapter(ProfileDatabaseAdapter):
         Raises:
             ValueError: If any profile data is invalid (NULL fields)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from any database row
         """
-        from db.db import read_all_profiles
-
-        return read_all_profiles()
+        return sqlite_db.read_all_profiles()
@@ -1,15 +1,93 @@
 """SQLite implementation of run database adapter."""
 
-import json
 import sqlite3
 from typing import Optional
 
+from pydantic import TypeAdapter, ValidationError
+
+from db import db as sqlite_db
 from db.adapters.base import RunDatabaseAdapter
 from db.exceptions import DuplicateTurnMetadataError
 from simulation.core.models.actions import TurnAction
 from simulation.core.models.runs import Run
 from simulation.core.models.turns import TurnMetadata
 
+# Decodes the JSON total_actions column directly into dict[TurnAction, int]
+# in pydantic-core, so JSON parsing and string -> TurnAction key conversion
+# happen in a single compiled pass instead of json.loads plus a Python loop.
+# Writes use the same adapter's dump_json, which encodes the enum keys as
+# their values without first rebuilding a str-keyed dict.
+_TOTAL_ACTIONS_ADAPTER: TypeAdapter[dict[TurnAction, int]] = TypeAdapter(
+    dict[TurnAction, int]
+)
+
+# Valid total_actions keys, computed once for error reporting rather than
+# rebuilt from the enum on every failed decode.
+_VALID_ACTION_VALUES: tuple[str, ...] = tuple(action.value for action in TurnAction)
+
+_TURN_METADATA_REQUIRED_COLUMNS = (
+    "run_id",
+    "turn_number",
+    "total_actions",
+    "created_at",
+)
+
+
+def _row_to_turn_metadata(row: sqlite3.Row) -> TurnMetadata:
+    """Convert a turn_metadata database row to a TurnMetadata model.
+
+    Args:
+        row: SQLite Row object containing turn_metadata data
+
+    Returns:
+        TurnMetadata model with total_actions keyed by TurnAction
+
+    Raises:
+        ValueError: If the row has NULL fields, unparseable JSON or invalid
+            action types
+        KeyError: If required columns are missing from the row
+    """
+    # Check required columns are present and not NULL in a single pass.
+    # The schema declares every column NOT NULL, so this is a cheap
+    # sanity check rather than the primary guard.
+    row_keys = row.keys()
+    for col in _TURN_METADATA_REQUIRED_COLUMNS:
+        if col not in row_keys:
+            raise KeyError(f"Missing required column '{col}' in turn_metadata row")
+        if row[col] is None:
+            raise ValueError(f"Turn metadata has NULL fields: {col}={row[col]}")
+
+    try:
+        total_actions = _TOTAL_ACTIONS_ADAPTER.validate_json(row["total_actions"])
+    except ValidationError as e:
+        error_types = {error["type"] for error in e.errors()}
+        if "json_invalid" in error_types:
+            raise ValueError(
+                f"Could not parse total_actions as JSON for turn_metadata: {e}"
+            )
+        if "enum" in error_types:
+            raise ValueError(
+                f"Invalid action type in total_actions for turn_metadata: {e}. "
+                f"Expected keys: {list(_VALID_ACTION_VALUES)}, got: {row['total_actions']}"
+            )
+        raise ValueError(
+            f"Invalid turn metadata data: {e}. "
+            f"run_id={row['run_id']}, turn_number={row['turn_number']}, total_actions={row['total_actions']}, created_at={row['created_at']}"
+        )
+
+    try:
+        return TurnMetadata(
+            run_id=row["run_id"],
+            turn_number=row["turn_number"],
+            total_actions=total_actions,
+            created_at=row["created_at"],
+        )
+    except Exception as e:
+        raise ValueError(
+            f"Invalid turn metadata data: {e}. "
+            f"run_id={row['run_id']}, turn_number={row['turn_number']}, total_actions={total_actions}, created_at={row['created_at']}"
+        )
+
 
 class SQLiteRunAdapter(RunDatabaseAdapter):
     """SQLite implementation of RunDatabaseAdapter.
@@ -27,9 +105,7 @@ class SQLiteRunAdapter(RunDatabaseAdapter):
             sqlite3.IntegrityError: If run_id violates constraints
             sqlite3.OperationalError: If database operation fails
         """
-        from db.db import write_run
-
-        write_run(run)
+        sqlite_db.write_run(run)
 
     def read_run(self, run_id: str) -> Optional[Run]:
         """Read a run from SQLite.
@@ -37,11 +113,8 @@ class SQLiteRunAdapter(RunDatabaseAdapter):
         Raises:
             ValueError: If the run data is invalid (NULL fields, invalid status)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from the database row
         """
-        from db.db import read_run
-
-        return read_run(run_id)
+        return sqlite_db.read_run(run_id)
 
     def read_all_runs(self) -> list[Run]:
         """Read all runs from SQLite.
@@ -49,11 +122,8 @@ class SQLiteRunAdapter(RunDatabaseAdapter):
         Raises:
             ValueError: If any run data is invalid (NULL fields, invalid status)
             sqlite3.OperationalError: If database operation fails
-            KeyError: If required columns are missing from any database row
         """
-        from db.db import read_all_runs
-
-        return read_all_runs()
+        return sqlite_db.read_all_runs()
 
     def update_run_status(
         self, run_id: str, status: str, completed_at: Optional[str] = None
@@ -65,9 +135,7 @@ class SQLiteRunAdapter(RunDatabaseAdapter):
             sqlite3.OperationalError: If database operation fails
             sqlite3.IntegrityError: If status value violates CHECK constraints
         """
-        from db.db import update_run_status
-
-        update_run_status(run_id, status, completed_at)
+        sqlite_db.update_run_status(run_id, status, completed_at)
 
     def read_turn_metadata(
         self, run_id: str, turn_number: int
@@ -91,105 +159,94 @@ class SQLiteRunAdapter(RunDatabaseAdapter):
         """
         from db.db import get_connection
 
-        with get_connection() as conn:
-            try:
-                row = conn.execute(
-                    "SELECT * FROM turn_metadata WHERE run_id = ? AND turn_number = ?",
-                    (run_id, turn_number),
-                ).fetchone()
-            except sqlite3.OperationalError:
-                raise
-
-            if row is None:
-                return None
-
-            # Check required columns
-            required_cols = ["run_id", "turn_number", "total_actions", "created_at"]
-            for col in required_cols:
-                if col not in row.keys():
-                    raise KeyError(
-                        f"Missing required column '{col}' in turn_metadata row"
-                    )
-
-            # Check for NULL fields
-            for col in required_cols:
-                if row[col] is None:
-                    raise ValueError(f"Turn metadata has NULL fields: {col}={row[col]}")
-
-            try:
-                total_actions_dict = json.loads(row["total_actions"])
-            except json.JSONDecodeError as e:
-                raise ValueError(
-                    f"Could not parse total_actions as JSON for turn_metadata: {e}"
-                )
+        try:
+            cursor = get_connection().execute(
+                "SELECT * FROM turn_metadata WHERE run_id = ? AND turn_number = ?",
+                (run_id, turn_number),
+            )
+            # _row_to_turn_metadata reads columns by name; rows are built
+            # on fetch, so the factory applies to this cursor only.
+            cursor.row_factory = sqlite3.Row
+            row = cursor.fetchone()
+        except sqlite3.OperationalError:
+            raise
 
-            # Convert string keys to TurnAction enum keys
-            try:
-                total_actions = {
-                    TurnAction(k): v for k, v in total_actions_dict.items()
-                }
-            except (ValueError, KeyError) as e:
-                valid_keys = [action.value for action in TurnAction]
-                raise ValueError(
-                    f"Invalid action type in total_actions for turn_metadata: {e}. "
-                    f"Expected keys: {valid_keys}, got: {list(total_actions_dict.keys())}"
-                )
+        if row is None:
+            return None
 
-            try:
-                return TurnMetadata(
-                    run_id=row["run_id"],
-                    turn_number=row["turn_number"],
-                    total_actions=total_actions,
-                    created_at=row["created_at"],
-                )
-            except Exception as e:
-                raise ValueError(
-                    f"Invalid turn metadata data: {e}. "
-                    f"run_id={row['run_id']}, turn_number={row['turn_number']}, total_actions={total_actions}, created_at={row['created_at']}"
-                )
+        return _row_to_turn_metadata(row)
 
-    def write_turn_metadata(self, turn_metadata: TurnMetadata) -> None:
-        """Write turn metadata to SQLite.
+    def read_turn_metadata_for_run(self, run_id: str) -> list[TurnMetadata]:
+        """Read turn metadata for every turn of a run from SQLite.
 
-        Writes to the `turn_metadata` table. Uses INSERT.
+        Fetches all turns in a single query instead of one query per turn.
 
         Args:
-            turn_metadata: TurnMetadata model to write
+            run_id: The ID of the run
+
+        Returns:
+            List of TurnMetadata ordered by turn_number. Returns empty list if
+            the run has no turn metadata.
 
         Raises:
+            ValueError: If the turn metadata data is invalid (NULL fields, invalid action types)
             sqlite3.OperationalError: If database operation fails
-            DuplicateTurnMetadataError: If turn metadata already exists
+            KeyError: If required columns are missing from the database row
         """
         from db.db import get_connection
 
-        existing_turn_metadata = self.read_turn_metadata(
-            turn_metadata.run_id, turn_metadata.turn_number
+        cursor = get_connection().execute(
+            "SELECT run_id, turn_number, total_actions, created_at "
+            "FROM turn_metadata WHERE run_id = ? ORDER BY turn_number",
+            (run_id,),
         )
+        # _row_to_turn_metadata reads columns by name; rows are built
+        # on fetch, so the factory applies to this cursor only.
+        cursor.row_factory = sqlite3.Row
+        return [_row_to_turn_metadata(row) for row in cursor]
 
-        if existing_turn_metadata is not None:
-            raise DuplicateTurnMetadataError(
-                turn_metadata.run_id, turn_metadata.turn_number
-            )
+    def write_turn_metadata(self, turn_metadata: TurnMetadata) -> None:
+        """Write turn metadata to SQLite.
+
+        Writes to the `turn_metadata` table inside `transaction()`, joining the
+        caller's transaction if one is open. A (run_id, turn_number) conflict
+        inserts nothing and is reported as a duplicate.
+
+        Args:
+            turn_metadata: TurnMetadata model to write
 
-        with get_connection() as conn:
-            total_actions_json = json.dumps(
-                {k.value: v for k, v in turn_metadata.total_actions.items()}
+        Raises:
+            sqlite3.OperationalError: If database operation fails
+            sqlite3.IntegrityError: If a NOT NULL or CHECK constraint fails
+            DuplicateTurnMetadataError: If turn metadata already exists
+        """
+        from db.db import transaction
+
+        with transaction() as conn:
+            total_actions_json = _TOTAL_ACTIONS_ADAPTER.dump_json(
+                turn_metadata.total_actions
+            ).decode()
+            # ON CONFLICT DO NOTHING turns only the PRIMARY KEY conflict into
+            # a no-op, so a duplicate is detected from rowcount without a
+            # separate SELECT (and JSON decode) before every write. Other
+            # constraint violations (NOT NULL, CHECK) still raise
+            # sqlite3.IntegrityError.
+            cursor = conn.execute(
+                "INSERT INTO turn_metadata (run_id, turn_number, total_actions, created_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (run_id, turn_number) DO NOTHING",
+                (
+                    turn_metadata.run_id,
+                    turn_metadata.turn_number,
+                    total_actions_json,
+                    turn_metadata.created_at,
+                ),
             )
-            try:
-                conn.execute(
-                    "INSERT INTO turn_metadata (run_id, turn_number, total_actions, created_at) VALUES (?, ?, ?, ?)",
-                    (
-                        turn_metadata.run_id,
-                        turn_metadata.turn_number,
-                        total_actions_json,
-                        turn_metadata.created_at,
-                    ),
-                )
-                conn.commit()
-            except sqlite3.IntegrityError:
-                # Defensive: handle constraint violations (bugs, edge cases, future changes)
-                # PRIMARY KEY violation indicates duplicate (run_id, turn_number)
+            if cursor.rowcount == 0:
+                # PRIMARY KEY conflict: (run_id, turn_number) already exists
                 raise DuplicateTurnMetadataError(
                     turn_metadata.run_id, turn_metadata.turn_number
                 )
+            # transaction() commits the insert, or joins the caller's open
+            # transaction so the caller's commit or rollback covers it.
             # sqlite3.OperationalError and other exceptions propagate as-is
@@ -19,126 +19,603 @@ without notice. They are used internally by:
 - db.adapters.sqlite.run_adapter
 """
 
-import json
+import atexit
 import os
 import sqlite3
-from typing import Optional
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Generic, Hashable, Iterable, Iterator, Optional, Sequence, TypeVar
+
+from pydantic import TypeAdapter
 
 from db.exceptions import RunNotFoundError
 from lib.utils import get_current_timestamp
 from simulation.core.models.feeds import GeneratedFeed
+from simulation.core.models.generated.base import GenerationMetadata
 from simulation.core.models.generated.bio import GeneratedBio
 from simulation.core.models.posts import BlueskyFeedPost
 from simulation.core.models.profiles import BlueskyProfile
-from simulation.core.models.runs import Run
+from simulation.core.models.runs import Run, RunStatus
+
+# SIMULATION_DB_PATH overrides the on-disk database. A "file:" URI is opened
+# as a URI, so query parameters such as "?mode=ro" apply. In-memory
+# databases only suit single-threaded use: a bare ":memory:" gives each
+# thread's connection its own private database, and a shared-cache memory
+# URI ("?mode=memory&cache=shared") uses table locks, so concurrent threads
+# can fail with "database table is locked" (SQLITE_LOCKED), which the busy
+# timeout does not retry. Multi-threaded runs need a database file.
+DB_PATH = os.getenv(
+    "SIMULATION_DB_PATH", os.path.join(os.path.dirname(__file__), "db.sqlite")
+)
+
+# Decodes the JSON-encoded post_uris column straight into a typed list[str]
+# in pydantic-core, fusing JSON parsing and type validation into one pass.
+# Raises pydantic.ValidationError (a ValueError) on malformed JSON.
+# Writes use the same adapter's dump_json, which serializes in Rust and emits
+# compact JSON text (no separator whitespace) so SQL JSON functions can still
+# read the column.
+_POST_URIS_ADAPTER: TypeAdapter[list[str]] = TypeAdapter(list[str])
+
+# Column lists for the model tables, in table order. They are used both as
+# the explicit SELECT lists and by the _row_to_* helpers, which read rows
+# positionally instead of by sqlite3.Row name lookup (a scan of the column
+# names per access). Every column is declared NOT NULL, so the helpers' NULL
+# check is a cheap sanity pass.
+_PROFILE_COLUMNS = (
+    "handle",
+    "did",
+    "display_name",
+    "bio",
+    "followers_count",
+    "follows_count",
+    "posts_count",
+)
+_GENERATED_FEED_COLUMNS = (
+    "feed_id",
+    "run_id",
+    "turn_number",
+    "agent_handle",
+    "post_uris",
+    "created_at",
+)
+_FEED_POST_COLUMNS = (
+    "uri",
+    "author_display_name",
+    "author_handle",
+    "text",
+    "bookmark_count",
+    "like_count",
+    "quote_count",
+    "reply_count",
+    "repost_count",
+    "created_at",
+)
+_GENERATED_BIO_COLUMNS = (
+    "handle",
+    "generated_bio",
+    "created_at",
+)
+_RUN_COLUMNS = (
+    "run_id",
+    "created_at",
+    "total_turns",
+    "total_agents",
+    "started_at",
+    "status",
+    "completed_at",
+)
+# completed_at is the only nullable runs column and is always last.
+_RUN_REQUIRED_COLUMNS = _RUN_COLUMNS[:-1]
+
+_SELECT_PROFILES = f"SELECT {', '.join(_PROFILE_COLUMNS)} FROM bluesky_profiles"
+_SELECT_GENERATED_FEEDS = (
+    f"SELECT {', '.join(_GENERATED_FEED_COLUMNS)} FROM generated_feeds"
+)
+_SELECT_FEED_POSTS = f"SELECT {', '.join(_FEED_POST_COLUMNS)} FROM bluesky_feed_posts"
+_SELECT_GENERATED_BIOS = f"SELECT {', '.join(_GENERATED_BIO_COLUMNS)} FROM agent_bios"
+_SELECT_RUNS = f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs"
+
+# Filtered reads are module constants rather than per-call f-strings, so a
+# repeat call reuses the same string object: no formatting, and its hash is
+# already cached for the connection's statement-cache lookup.
+_SELECT_PROFILE_BY_HANDLE = f"{_SELECT_PROFILES} WHERE handle = ?"
+_SELECT_FEED_POST_BY_URI = f"{_SELECT_FEED_POSTS} WHERE uri = ?"
+_SELECT_FEED_POSTS_BY_AUTHOR = f"{_SELECT_FEED_POSTS} WHERE author_handle = ?"
+_SELECT_FEED_POSTS_PAGE = f"{_SELECT_FEED_POSTS} ORDER BY uri LIMIT ? OFFSET ?"
+_SELECT_GENERATED_BIO_BY_HANDLE = f"{_SELECT_GENERATED_BIOS} WHERE handle = ?"
+_SELECT_GENERATED_FEED_BY_KEY = (
+    f"{_SELECT_GENERATED_FEEDS} "
+    "WHERE agent_handle = ? AND run_id = ? AND turn_number = ?"
+)
+_SELECT_RUN_BY_ID = f"{_SELECT_RUNS} WHERE run_id = ?"
+_SELECT_RUNS_NEWEST_FIRST = f"{_SELECT_RUNS} ORDER BY created_at DESC"
+
+_RUN_STATUS_BY_VALUE = {status.value: status for status in RunStatus}
+
+
+def _upsert_sql(
+    table: str, columns: tuple[str, ...], conflict_columns: tuple[str, ...]
+) -> str:
+    """Build an INSERT ... ON CONFLICT DO UPDATE statement for a table.
+
+    Unlike INSERT OR REPLACE, which deletes the conflicting row and inserts a
+    new one, the upsert updates the existing row in place.
+
+    Args:
+        table: Table to write to
+        columns: Columns bound, in order, to the statement's parameters
+        conflict_columns: Primary key columns that identify an existing row
+
+    Returns:
+        SQL statement with one "?" parameter per column
+    """
+    assignments = ", ".join(
+        f"{column} = excluded.{column}"
+        for column in columns
+        if column not in conflict_columns
+    )
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))}) "
+        f"ON CONFLICT ({', '.join(conflict_columns)}) DO UPDATE SET {assignments}"
+    )
+
+
+_UPSERT_PROFILE = _upsert_sql("bluesky_profiles", _PROFILE_COLUMNS, ("handle",))
+_UPSERT_FEED_POST = _upsert_sql("bluesky_feed_posts", _FEED_POST_COLUMNS, ("uri",))
+_UPSERT_GENERATED_BIO = _upsert_sql("agent_bios", _GENERATED_BIO_COLUMNS, ("handle",))
+_UPSERT_GENERATED_FEED = _upsert_sql(
+    "generated_feeds",
+    _GENERATED_FEED_COLUMNS,
+    ("agent_handle", "run_id", "turn_number"),
+)
+_UPSERT_RUN = _upsert_sql("runs", _RUN_COLUMNS, ("run_id",))
+_UPDATE_RUN_STATUS = "UPDATE runs SET status = ?, completed_at = ? WHERE run_id = ?"
+
+_SELECT_RUN_POST_URIS = """
+    SELECT DISTINCT uris.value
+    FROM generated_feeds, json_each(generated_feeds.post_uris) AS uris
+    WHERE agent_handle = ? AND run_id = ?
+"""
+
+
+# Per-connection (session) pragmas. journal_mode=WAL is persistent in the
+# database file and is set once by initialize_database(); with WAL,
+# synchronous=NORMAL only syncs at checkpoints instead of on every commit.
+# mmap_size lets full-table scans read pages straight from the OS page cache
+# instead of copying them into SQLite's cache; it reserves up to 256 MiB of
+# virtual address space per connection (not resident memory) and is capped
+# at the database file's size.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped I/O
+)
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply the session pragmas to a newly opened connection.
+
+    Args:
+        conn: Connection to configure
+    """
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+# Size of each connection's prepared-statement cache. sqlite3 keys the cache
+# by SQL text, so with long-lived connections every fixed query string is
+# compiled once per connection; the headroom over the default (128) leaves
+# room for the variable-arity IN (...) lookups without evicting fixed ones.
+_STATEMENT_CACHE_SIZE = 256
+
+# How long a connection waits on a locked database (SQLITE_BUSY) before
+# raising sqlite3.OperationalError. This is sqlite3.connect's default too;
+# it is set explicitly because concurrent writers (other threads or
+# processes) rely on it rather than on retry loops.
+_BUSY_TIMEOUT_SECONDS = 5.0
+
+# One long-lived connection per thread, reused across calls instead of
+# reopening the database file (and re-applying pragmas) on every operation.
+# sqlite3 connections must not be shared across threads by default, so each
+# thread gets its own.
+_thread_local = threading.local()
 
-DB_PATH = os.path.join(os.path.dirname(__file__), "db.sqlite")
+# Rows fetched per cursor.fetchmany() call by the iter_all_* readers.
+_ITER_BATCH_SIZE = 1000
+
+# Maximum number of bound parameters per `IN (...)` lookup. Larger key sets
+# are split into several queries; 999 is SQLite's historical (pre-3.32)
+# SQLITE_MAX_VARIABLE_NUMBER, so it is safe with any build.
+_MAX_IN_PARAMS = 999
 
 
 def get_connection() -> sqlite3.Connection:
-    """Get a database connection.
+    """Get the calling thread's database connection.
+
+    The connection is opened on first use and cached for the thread. It is
+    reopened if DB_PATH has changed since it was opened. Readers call
+    `get_connection()` directly; writers go through `transaction()`. Do not
+    use `with get_connection() as conn:`: the connection is shared by every
+    caller on the thread, so the context manager's commit on exit would also
+    commit an enclosing `transaction()` early.
+
+    Rows come back as plain tuples: every reader selects an explicit column
+    list and unpacks it positionally, which is cheaper than building a
+    sqlite3.Row per row. A caller that needs name access sets
+    `cursor.row_factory = sqlite3.Row` on its own cursor.
 
     Returns:
-        SQLite connection to db.sqlite
+        SQLite connection to DB_PATH
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    conn = getattr(_thread_local, "conn", None)
+    if conn is not None and _thread_local.path == DB_PATH:
+        return conn
+
+    if conn is not None:
+        conn.close()
+    conn = sqlite3.connect(
+        DB_PATH,
+        timeout=_BUSY_TIMEOUT_SECONDS,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+        uri=DB_PATH.startswith("file:"),
+    )
+    _apply_pragmas(conn)
+    _thread_local.conn = conn
+    _thread_local.path = DB_PATH
+    _thread_local.data_version = None
     return conn
 
 
-def initialize_database() -> None:
-    """Initialize the database by creating tables if they don't exist."""
-    with get_connection() as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS bluesky_profiles (
-                handle TEXT PRIMARY KEY,
-                did TEXT NOT NULL,
-                display_name TEXT NOT NULL,
-                bio TEXT NOT NULL,
-                followers_count INTEGER NOT NULL,
-                follows_count INTEGER NOT NULL,
-                posts_count INTEGER NOT NULL
-            )
-        """)
-
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS bluesky_feed_posts (
-                uri TEXT PRIMARY KEY,
-                author_display_name TEXT NOT NULL,
-                author_handle TEXT NOT NULL,
-                text TEXT NOT NULL,
-                bookmark_count INTEGER NOT NULL,
-                like_count INTEGER NOT NULL,
-                quote_count INTEGER NOT NULL,
-                reply_count INTEGER NOT NULL,
-                repost_count INTEGER NOT NULL,
-                created_at TEXT NOT NULL
-            )
-        """)
-
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS agent_bios (
-                handle TEXT PRIMARY KEY,
-                generated_bio TEXT NOT NULL,
-                created_at TEXT NOT NULL
-            )
-        """)
-
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS generated_feeds (
-                feed_id TEXT NOT NULL,
-                run_id TEXT NOT NULL,
-                turn_number INTEGER NOT NULL,
-                agent_handle TEXT NOT NULL,
-                post_uris TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                PRIMARY KEY (agent_handle, run_id, turn_number)
-            )
-        """)
-
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS runs (
-                run_id TEXT PRIMARY KEY,
-                created_at TEXT NOT NULL,
-                total_turns INTEGER NOT NULL CHECK (total_turns > 0),
-                total_agents INTEGER NOT NULL CHECK (total_agents > 0),
-                started_at TEXT NOT NULL,
-                status TEXT NOT NULL CHECK(status IN ('running', 'completed', 'failed')),
-                completed_at TEXT NULL,
-                CHECK (
-                    (status = 'completed' AND completed_at IS NOT NULL AND completed_at >= started_at) OR
-                    (status != 'completed' AND completed_at IS NULL)
-                )
-            )
-        """)
-
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS turn_metadata (
-                run_id TEXT NOT NULL REFERENCES runs(run_id),
-                turn_number INTEGER NOT NULL CHECK (turn_number >= 0),
-                total_actions TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                PRIMARY KEY (run_id, turn_number)
-            )
-        """)
-
-        # Create indexes for frequently queried columns
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status)
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at DESC)
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_bluesky_feed_posts_author_handle 
-            ON bluesky_feed_posts(author_handle)
-        """)
-
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_turn_metadata_run_id ON turn_metadata(run_id)
-        """)
+def close_connection() -> None:
+    """Close the calling thread's cached connection, if any.
+
+    Runs `PRAGMA optimize` first so SQLite can refresh query planner
+    statistics gathered during the connection's lifetime. The next
+    `get_connection()` call opens a fresh connection.
+    """
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        return
+
+    _thread_local.conn = None
+    _thread_local.cursor = None
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        # Best effort: optimize must never prevent the connection closing.
+        pass
+    finally:
+        conn.close()
+
+
+atexit.register(close_connection)
+
+
+_ModelT = TypeVar("_ModelT", BlueskyProfile, BlueskyFeedPost)
+
+
+class _ReadCache(Generic[_ModelT]):
+    """Thread-safe, bounded LRU cache of models read by primary key.
+
+    Keys are scoped to DB_PATH, so pointing DB_PATH at another database file
+    never serves rows from the previous one. Writers in this module
+    invalidate the keys they touched once their transaction has finished
+    (see _invalidate_written). Readers only use the cache outside a
+    transaction and drop it when another connection has committed (see
+    _read_caches_usable), so uncommitted rows are never cached and rows
+    changed by other processes are not served stale.
+
+    Every invalidate() or clear() bumps a generation counter. A reader takes
+    generation() before its SELECT and passes it to put(), which drops the
+    model if any invalidation happened in between: the row may have been
+    read before a concurrent write committed.
+
+    Cached models are never handed out directly: get() returns a copy, so a
+    caller mutating its result cannot corrupt the cache.
+    """
 
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, Hashable], _ModelT] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def generation(self) -> int:
+        """Return the current invalidation generation, for a later put()."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[_ModelT]:
+        """Return a copy of the cached model for key, or None on a miss."""
+        with self._lock:
+            model = self._entries.get((DB_PATH, key))
+            if model is None:
+                return None
+            self._entries.move_to_end((DB_PATH, key))
+        return model.model_copy()
+
+    def put(self, key: Hashable, model: _ModelT, generation: int) -> None:
+        """Cache a copy of model under key, evicting the least recently used entry.
+
+        Does nothing if the cache has been invalidated since `generation`
+        was taken, since the model may then predate a committed write.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[(DB_PATH, key)] = model.model_copy()
+            self._entries.move_to_end((DB_PATH, key))
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Iterable[Hashable]) -> None:
+        """Drop any cached models for the given keys."""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop((DB_PATH, key), None)
+
+    def clear(self) -> None:
+        """Drop every cached model."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+# Read-through caches for the hot point lookups. Only found rows are cached,
+# so a profile or post inserted later is never hidden by a cached miss.
+_PROFILE_CACHE: _ReadCache[BlueskyProfile] = _ReadCache(maxsize=4096)
+_FEED_POST_CACHE: _ReadCache[BlueskyFeedPost] = _ReadCache(maxsize=4096)
+
+
+def _read_caches_usable(cursor: sqlite3.Cursor) -> bool:
+    """Check whether a point read may use the read caches.
+
+    Inside a transaction the cache is bypassed entirely: a cached row may be
+    older than the transaction's own writes, and a row read there may never
+    be committed. Outside one, `PRAGMA data_version` tells whether another
+    connection (another thread or process) has committed since this
+    thread's last check; if so, both caches are dropped.
+
+    Args:
+        cursor: Cursor on the calling thread's connection
+
+    Returns:
+        True if the caller may read from and fill the caches
+    """
+    if cursor.connection.in_transaction:
+        return False
+
+    data_version = cursor.execute("PRAGMA data_version").fetchone()[0]
+    if data_version != _thread_local.data_version:
+        _PROFILE_CACHE.clear()
+        _FEED_POST_CACHE.clear()
+        _thread_local.data_version = data_version
+    return True
+
+
+def _invalidate_written(cache: _ReadCache, keys: Iterable[Hashable]) -> None:
+    """Drop cached models for keys the calling thread has just written.
+
+    Writers call this after their `transaction()` block. Dropping the keys
+    bumps the cache generation, so a concurrent reader that selected the old
+    row before the commit cannot put it back (see _ReadCache.put). If the
+    write joined an enclosing transaction, the keys are dropped again when
+    that transaction ends: until then other threads still read, and may
+    cache, the old committed row.
+
+    Args:
+        cache: Cache holding models of the written table
+        keys: Primary keys of the written rows
+    """
+    keys = list(keys)
+    cache.invalidate(keys)
+    if get_connection().in_transaction:
+        pending = getattr(_thread_local, "pending_invalidations", None)
+        if pending is None:
+            pending = _thread_local.pending_invalidations = []
+        pending.append((cache, keys))
+
+
+def _run_pending_invalidations() -> None:
+    """Drop the keys written inside the calling thread's finished transaction."""
+    pending = getattr(_thread_local, "pending_invalidations", None)
+    if not pending:
+        return
+
+    _thread_local.pending_invalidations = None
+    for cache, keys in pending:
+        cache.invalidate(keys)
+
+
+def _lookup_cursor() -> sqlite3.Cursor:
+    """Get the calling thread's reusable cursor for single-row lookups.
+
+    Saves allocating a cursor per `conn.execute()` on hot point reads. Only
+    use it for queries whose result is fully consumed before returning
+    (e.g. a fetchone() on a primary key), so that no caller is left holding
+    a half-read result when the cursor is re-executed.
+
+    Returns:
+        Cursor on the connection returned by get_connection()
+    """
+    conn = get_connection()
+    cursor = getattr(_thread_local, "cursor", None)
+    if cursor is None or cursor.connection is not conn:
+        cursor = conn.cursor()
+        _thread_local.cursor = cursor
+    return cursor
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Run the enclosed statements in a single transaction.
+
+    Begins with BEGIN IMMEDIATE so the write lock is taken up front, commits
+    once when the block exits and rolls back if it raises. If the calling
+    thread's connection is already in a transaction (e.g. nested
+    `transaction()` blocks), the enclosed statements join it and the
+    outermost block commits, so wrapping many single-row writes in one
+    `transaction()` costs a single commit. Every db helper that writes joins
+    this way except `initialize_database()`, whose schema script commits
+    implicitly; it raises instead of running inside a transaction.
+
+    Yields:
+        The calling thread's SQLite connection
+    """
+    conn = get_connection()
+    if conn.in_transaction:
+        yield conn
+        return
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
         conn.commit()
+    finally:
+        # Whether committed or rolled back, drop cache entries for rows
+        # written inside the transaction that other threads may have
+        # re-cached from the old committed state meanwhile.
+        _run_pending_invalidations()
+
+
+# STRICT tables (SQLite 3.37+) reject values that don't match the declared
+# column type instead of silently storing e.g. a numeric string in an INTEGER
+# column, so counts are always stored and read back as compact integers.
+# Older SQLite builds can't parse the keyword and get ordinary tables.
+_STRICT_TABLE = " STRICT" if sqlite3.sqlite_version_info >= (3, 37, 0) else ""
+
+
+# Version of _SCHEMA_SQL, recorded in the database header (PRAGMA
+# user_version) once the schema is applied. Bump it whenever the DDL below
+# changes so existing databases pick up the change on the next
+# initialize_database().
+_SCHEMA_VERSION = 1
+
+# Full schema, run by initialize_database() as one script in one transaction.
+_SCHEMA_SQL = f"""
+    BEGIN;
+
+    CREATE TABLE IF NOT EXISTS bluesky_profiles (
+        handle TEXT PRIMARY KEY,
+        did TEXT NOT NULL,
+        display_name TEXT NOT NULL,
+        bio TEXT NOT NULL,
+        followers_count INTEGER NOT NULL,
+        follows_count INTEGER NOT NULL,
+        posts_count INTEGER NOT NULL
+    ){_STRICT_TABLE};
+
+    CREATE TABLE IF NOT EXISTS bluesky_feed_posts (
+        uri TEXT PRIMARY KEY,
+        author_display_name TEXT NOT NULL,
+        author_handle TEXT NOT NULL,
+        text TEXT NOT NULL,
+        bookmark_count INTEGER NOT NULL,
+        like_count INTEGER NOT NULL,
+        quote_count INTEGER NOT NULL,
+        reply_count INTEGER NOT NULL,
+        repost_count INTEGER NOT NULL,
+        created_at TEXT NOT NULL
+    ){_STRICT_TABLE};
+
+    CREATE TABLE IF NOT EXISTS agent_bios (
+        handle TEXT PRIMARY KEY,
+        generated_bio TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    ){_STRICT_TABLE};
+
+    CREATE TABLE IF NOT EXISTS generated_feeds (
+        feed_id TEXT NOT NULL,
+        run_id TEXT NOT NULL,
+        turn_number INTEGER NOT NULL,
+        agent_handle TEXT NOT NULL,
+        post_uris TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        PRIMARY KEY (agent_handle, run_id, turn_number)
+    ){_STRICT_TABLE};
+
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        created_at TEXT NOT NULL,
+        total_turns INTEGER NOT NULL CHECK (total_turns > 0),
+        total_agents INTEGER NOT NULL CHECK (total_agents > 0),
+        started_at TEXT NOT NULL,
+        status TEXT NOT NULL CHECK(status IN ('running', 'completed', 'failed')),
+        completed_at TEXT NULL,
+        CHECK (
+            (status = 'completed' AND completed_at IS NOT NULL AND completed_at >= started_at) OR
+            (status != 'completed' AND completed_at IS NULL)
+        )
+    ){_STRICT_TABLE};
+
+    CREATE TABLE IF NOT EXISTS turn_metadata (
+        run_id TEXT NOT NULL REFERENCES runs(run_id),
+        turn_number INTEGER NOT NULL CHECK (turn_number >= 0),
+        total_actions TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        PRIMARY KEY (run_id, turn_number)
+    ){_STRICT_TABLE};
+
+    -- Indexes for frequently queried columns
+    CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status);
+    CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_bluesky_feed_posts_author_handle
+        ON bluesky_feed_posts(author_handle);
+    CREATE INDEX IF NOT EXISTS idx_turn_metadata_run_id ON turn_metadata(run_id);
+
+    -- generated_feeds' primary key (agent_handle, run_id, turn_number)
+    -- already serves agent_handle + run_id lookups; per-turn reads filter
+    -- on run_id + turn_number and need their own index.
+    CREATE INDEX IF NOT EXISTS idx_generated_feeds_run_id_turn_number
+        ON generated_feeds(run_id, turn_number);
+
+    PRAGMA user_version = {_SCHEMA_VERSION};
+
+    COMMIT;
+"""
+
+
+def initialize_database() -> None:
+    """Initialize the database by creating tables if they don't exist.
+
+    Also switches the database to WAL journaling, which is persistent in the
+    database file, so it only needs to be set here.
+
+    The schema is applied with a single executescript() call wrapped in one
+    transaction, so it is created atomically with a single commit. The same
+    transaction stamps the database with _SCHEMA_VERSION; a database already
+    at that version is returned from immediately, without re-running the
+    DDL.
+
+    Must not be called inside `transaction()`: executescript() commits any
+    open transaction before running the script, which would commit the
+    caller's pending writes out from under it.
+
+    Raises:
+        RuntimeError: If the calling thread's connection is in a transaction
+    """
+    conn = get_connection()
+    if conn.in_transaction:
+        raise RuntimeError("initialize_database() cannot run inside a transaction")
+    if conn.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+        return
+
+    # journal_mode can't be changed inside a transaction, so it runs first.
+    conn.execute("PRAGMA journal_mode=WAL")
+    try:
+        conn.executescript(_SCHEMA_SQL)
+    except BaseException:
+        # A failing statement leaves the script's BEGIN open.
+        if conn.in_transaction:
+            conn.rollback()
+        raise
 
 
 def write_profile(profile: BlueskyProfile) -> None:
@@ -154,13 +631,9 @@ def write_profile(profile: BlueskyProfile) -> None:
         sqlite3.IntegrityError: If handle violates constraints
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
+    with transaction() as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO bluesky_profiles 
-            (handle, did, display_name, bio, followers_count, follows_count, posts_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
+            _UPSERT_PROFILE,
             (
                 profile.handle,
                 profile.did,
@@ -171,7 +644,49 @@ def write_profile(profile: BlueskyProfile) -> None:
                 profile.posts_count,
             ),
         )
-        conn.commit()
+
+    _invalidate_written(_PROFILE_CACHE, (profile.handle,))
+
+
+def write_profiles(profiles: list[BlueskyProfile]) -> None:
+    """Write multiple Bluesky profiles to the database (batch operation).
+
+    INTERNAL: This function is an implementation detail used by SQLiteProfileAdapter.
+    External code should use ProfileRepository.create_or_update_profiles() instead.
+
+    This function uses executemany for efficient batch insertion. All profiles
+    are written in a single atomic transaction. If any profile fails, the entire
+    batch will be rolled back.
+
+    Args:
+        profiles: List of BlueskyProfile models to write. Empty list is allowed
+                  and will result in no database operations.
+
+    Raises:
+        sqlite3.IntegrityError: If any handle violates constraints
+        sqlite3.OperationalError: If database operation fails
+    """
+    if not profiles:
+        return
+
+    with transaction() as conn:
+        conn.executemany(
+            _UPSERT_PROFILE,
+            (
+                (
+                    profile.handle,
+                    profile.did,
+                    profile.display_name,
+                    profile.bio,
+                    profile.followers_count,
+                    profile.follows_count,
+                    profile.posts_count,
+                )
+                for profile in profiles
+            ),
+        )
+
+    _invalidate_written(_PROFILE_CACHE, (profile.handle for profile in profiles))
 
 
 def write_feed_post(post: BlueskyFeedPost) -> None:
@@ -187,14 +702,9 @@ def write_feed_post(post: BlueskyFeedPost) -> None:
         sqlite3.IntegrityError: If uri violates constraints
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
+    with transaction() as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO bluesky_feed_posts
-            (uri, author_display_name, author_handle, text, bookmark_count,
-             like_count, quote_count, reply_count, repost_count, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+            _UPSERT_FEED_POST,
             (
                 post.uri,
                 post.author_display_name,
@@ -208,7 +718,8 @@ def write_feed_post(post: BlueskyFeedPost) -> None:
                 post.created_at,
             ),
         )
-        conn.commit()
+
+    _invalidate_written(_FEED_POST_CACHE, (post.uri,))
 
 
 def write_feed_posts(posts: list[BlueskyFeedPost]) -> None:
@@ -232,35 +743,27 @@ def write_feed_posts(posts: list[BlueskyFeedPost]) -> None:
     if not posts:
         return
 
-    with get_connection() as conn:
-        try:
-            conn.executemany(
-                """
-                INSERT OR REPLACE INTO bluesky_feed_posts
-                (uri, author_display_name, author_handle, text, bookmark_count,
-                 like_count, quote_count, reply_count, repost_count, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                [
-                    (
-                        post.uri,
-                        post.author_display_name,
-                        post.author_handle,
-                        post.text,
-                        post.bookmark_count,
-                        post.like_count,
-                        post.quote_count,
-                        post.reply_count,
-                        post.repost_count,
-                        post.created_at,
-                    )
-                    for post in posts
-                ],
-            )
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+    with transaction() as conn:
+        conn.executemany(
+            _UPSERT_FEED_POST,
+            (
+                (
+                    post.uri,
+                    post.author_display_name,
+                    post.author_handle,
+                    post.text,
+                    post.bookmark_count,
+                    post.like_count,
+                    post.quote_count,
+                    post.reply_count,
+                    post.repost_count,
+                    post.created_at,
+                )
+                for post in posts
+            ),
+        )
+
+    _invalidate_written(_FEED_POST_CACHE, (post.uri for post in posts))
 
 
 def write_generated_bio_to_database(
@@ -282,16 +785,40 @@ def write_generated_bio_to_database(
     """
     if created_at is None:
         created_at = get_current_timestamp()
-    with get_connection() as conn:
+    with transaction() as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO agent_bios
-            (handle, generated_bio, created_at)
-            VALUES (?, ?, ?)
-        """,
+            _UPSERT_GENERATED_BIO,
             (handle, generated_bio, created_at),
         )
-        conn.commit()
+
+
+def write_generated_bios(bios: list[GeneratedBio]) -> None:
+    """Write multiple generated bios to the database (batch operation).
+
+    INTERNAL: This function is an implementation detail used by SQLiteGeneratedBioAdapter.
+    External code should use GeneratedBioRepository.create_or_update_generated_bios() instead.
+
+    This function uses executemany for efficient batch insertion. All bios
+    are written in a single atomic transaction. If any bio fails, the entire
+    batch will be rolled back.
+
+    Args:
+        bios: List of GeneratedBio models to write. Each row's created_at is
+              taken from bio.metadata.created_at. Empty list is allowed and
+              will result in no database operations.
+
+    Raises:
+        sqlite3.IntegrityError: If any handle violates constraints
+        sqlite3.OperationalError: If database operation fails
+    """
+    if not bios:
+        return
+
+    with transaction() as conn:
+        conn.executemany(
+            _UPSERT_GENERATED_BIO,
+            ((bio.handle, bio.generated_bio, bio.metadata.created_at) for bio in bios),
+        )
 
 
 # TODO: we create a feed_id even though the PK for now is
@@ -310,23 +837,57 @@ def write_generated_feed(feed: GeneratedFeed) -> None:
         sqlite3.IntegrityError: If composite key (agent_handle, run_id, turn_number) violates constraints
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
+    with transaction() as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO generated_feeds
-            (feed_id, run_id, turn_number, agent_handle, post_uris, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
+            _UPSERT_GENERATED_FEED,
             (
                 feed.feed_id,
                 feed.run_id,
                 feed.turn_number,
                 feed.agent_handle,
-                json.dumps(feed.post_uris),
+                _POST_URIS_ADAPTER.dump_json(feed.post_uris).decode(),
                 feed.created_at,
             ),
         )
-        conn.commit()
+
+
+def write_generated_feeds(feeds: list[GeneratedFeed]) -> None:
+    """Write multiple generated feeds to the database (batch operation).
+
+    INTERNAL: This function is an implementation detail used by SQLiteGeneratedFeedAdapter.
+    GeneratedFeedRepository has no batch method; external code writes feeds
+    with GeneratedFeedRepository.create_or_update_generated_feed().
+
+    This function uses executemany for efficient batch insertion. All feeds
+    are written in a single atomic transaction. If any feed fails, the entire
+    batch will be rolled back.
+
+    Args:
+        feeds: List of GeneratedFeed models to write. Empty list is allowed
+               and will result in no database operations.
+
+    Raises:
+        sqlite3.IntegrityError: If any composite key (agent_handle, run_id, turn_number) violates constraints
+        sqlite3.OperationalError: If database operation fails
+    """
+    if not feeds:
+        return
+
+    with transaction() as conn:
+        conn.executemany(
+            _UPSERT_GENERATED_FEED,
+            (
+                (
+                    feed.feed_id,
+                    feed.run_id,
+                    feed.turn_number,
+                    feed.agent_handle,
+                    _POST_URIS_ADAPTER.dump_json(feed.post_uris).decode(),
+                    feed.created_at,
+                )
+                for feed in feeds
+            ),
+        )
 
 
 def write_run(run: Run) -> None:
@@ -338,10 +899,8 @@ def write_run(run: Run) -> None:
     This function creates or replaces a single run record within
     its own transaction scope. If you need to perform multi-table
     operations that must succeed or fail together (e.g., creating a run
-    and related records in other tables), you are responsible for
-    managing the transaction boundaries externally. Use a single
-    database connection and control commit/rollback yourself in such cases,
-    or refactor to accept an existing connection.
+    and related records in other tables), wrap the calls in `transaction()`;
+    the writes then join that transaction and commit together.
 
     Args:
         run: Run model to write
@@ -351,16 +910,12 @@ def write_run(run: Run) -> None:
         sqlite3.OperationalError: If database operation fails
 
     Note:
-        Uses INSERT OR REPLACE, so this will overwrite existing runs
-        with the same run_id.
+        Upserts on run_id, so this will overwrite an existing run's
+        columns in place.
     """
-    with get_connection() as conn:
+    with transaction() as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO runs 
-            (run_id, created_at, total_turns, total_agents, started_at, status, completed_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
+            _UPSERT_RUN,
             (
                 run.run_id,
                 run.created_at,
@@ -371,7 +926,195 @@ def write_run(run: Run) -> None:
                 run.completed_at,
             ),
         )
-        conn.commit()
+
+
+def _validate_not_null(
+    row: Sequence[object], columns: tuple[str, ...], context: str | None = None
+) -> None:
+    """Validate that no value in a positional row is NULL.
+
+    Args:
+        row: Row values, in the order of `columns`
+        columns: Column names for the row, used in the error message
+        context: Optional context string to include in error messages
+                 (e.g., "feed post uri=at://did:plc:.../app.bsky.feed.post/...")
+
+    Raises:
+        ValueError: If any value is NULL. Error message includes the first
+                    NULL column name and optional context.
+    """
+    if None not in row:
+        return
+
+    field = next(col for col, value in zip(columns, row) if value is None)
+    error_msg = f"{field} cannot be NULL"
+    if context:
+        error_msg = f"{error_msg} (context: {context})"
+    raise ValueError(error_msg)
+
+
+def _check_column_count(
+    row: Sequence[object], columns: tuple[str, ...], table: str
+) -> None:
+    """Validate that a positional row has exactly one value per column.
+
+    Args:
+        row: Row values, in the order of `columns`
+        columns: Column names selected for the row
+        table: Table the row was read from, used in the error message
+
+    Raises:
+        ValueError: If the row has more or fewer values than `columns`
+    """
+    if len(row) != len(columns):
+        raise ValueError(
+            f"{table} row has {len(row)} columns, expected {len(columns)}: "
+            f"{', '.join(columns)}"
+        )
+
+
+def _row_to_generated_feed(row: Sequence) -> GeneratedFeed:
+    """Convert a generated_feeds row to a GeneratedFeed model.
+
+    Args:
+        row: Row values selected with _SELECT_GENERATED_FEEDS
+
+    Returns:
+        GeneratedFeed model instance
+
+    Raises:
+        ValueError: If the row has the wrong number of columns, any field is
+            NULL or post_uris is not a valid JSON list of strings
+    """
+    _check_column_count(row, _GENERATED_FEED_COLUMNS, "generated_feeds")
+    # The context is only built for a row that actually has a NULL.
+    if None in row:
+        _, run_id, turn_number, agent_handle, _, _ = (
+            value if value is not None else "unknown" for value in row
+        )
+        _validate_not_null(
+            row,
+            _GENERATED_FEED_COLUMNS,
+            f"generated feed agent_handle={agent_handle}, run_id={run_id}, turn_number={turn_number}",
+        )
+    feed_id, run_id, turn_number, agent_handle, post_uris, created_at = row
+    return GeneratedFeed(
+        feed_id=feed_id,
+        run_id=run_id,
+        turn_number=turn_number,
+        agent_handle=agent_handle,
+        post_uris=_POST_URIS_ADAPTER.validate_json(post_uris),
+        created_at=created_at,
+    )
+
+
+def _row_to_profile(row: Sequence) -> BlueskyProfile:
+    """Convert a bluesky_profiles row to a BlueskyProfile model.
+
+    Args:
+        row: Row values selected with _SELECT_PROFILES
+
+    Returns:
+        BlueskyProfile model instance
+
+    Raises:
+        ValueError: If the row has the wrong number of columns or any field
+            is NULL
+    """
+    _check_column_count(row, _PROFILE_COLUMNS, "bluesky_profiles")
+    _validate_not_null(row, _PROFILE_COLUMNS)
+    handle, did, display_name, bio, followers_count, follows_count, posts_count = row
+    return BlueskyProfile(
+        handle=handle,
+        did=did,
+        display_name=display_name,
+        bio=bio,
+        followers_count=followers_count,
+        follows_count=follows_count,
+        posts_count=posts_count,
+    )
+
+
+def _row_to_feed_post(row: Sequence, context: str | None = None) -> BlueskyFeedPost:
+    """Convert a bluesky_feed_posts row to a BlueskyFeedPost model.
+
+    Args:
+        row: Row values selected with _SELECT_FEED_POSTS
+        context: Optional detail appended to the row's uri in the NULL
+                 error message (e.g., "author_handle=user.bsky.social")
+
+    Returns:
+        BlueskyFeedPost model instance
+
+    Raises:
+        ValueError: If the row has the wrong number of columns or any field
+            is NULL
+    """
+    _check_column_count(row, _FEED_POST_COLUMNS, "bluesky_feed_posts")
+    # The context is only built for a row that actually has a NULL.
+    if None in row:
+        uri_value = row[0] if row[0] is not None else "unknown"
+        row_context = f"feed post uri={uri_value}"
+        if context:
+            row_context = f"{row_context}, {context}"
+        _validate_not_null(row, _FEED_POST_COLUMNS, row_context)
+    (
+        uri,
+        author_display_name,
+        author_handle,
+        text,
+        bookmark_count,
+        like_count,
+        quote_count,
+        reply_count,
+        repost_count,
+        created_at,
+    ) = row
+    return BlueskyFeedPost(
+        id=uri,
+        uri=uri,
+        author_display_name=author_display_name,
+        author_handle=author_handle,
+        text=text,
+        bookmark_count=bookmark_count,
+        like_count=like_count,
+        quote_count=quote_count,
+        reply_count=reply_count,
+        repost_count=repost_count,
+        created_at=created_at,
+    )
+
+
+def _row_to_generated_bio(row: Sequence) -> GeneratedBio:
+    """Convert an agent_bios row to a GeneratedBio model.
+
+    Args:
+        row: Row values selected with _SELECT_GENERATED_BIOS
+
+    Returns:
+        GeneratedBio model instance
+
+    Raises:
+        ValueError: If the row has the wrong number of columns or any field
+            is NULL
+    """
+    _check_column_count(row, _GENERATED_BIO_COLUMNS, "agent_bios")
+    # The context is only built for a row that actually has a NULL.
+    if None in row:
+        handle_value = row[0] if row[0] is not None else "unknown"
+        _validate_not_null(
+            row, _GENERATED_BIO_COLUMNS, f"generated bio handle={handle_value}"
+        )
+    handle, generated_bio, created_at = row
+    return GeneratedBio(
+        handle=handle,
+        generated_bio=generated_bio,
+        metadata=GenerationMetadata(
+            model_used=None,
+            generation_metadata=None,
+            created_at=created_at,
+        ),
+    )
 
 
 def read_generated_feed(
@@ -393,147 +1136,124 @@ def read_generated_feed(
     Raises:
         ValueError: If no feed is found for the given agent_handle, run_id, and turn_number
         ValueError: If the feed data is invalid (NULL fields)
-        KeyError: If required columns are missing from the database row
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM generated_feeds WHERE agent_handle = ? AND run_id = ? AND turn_number = ?",
-            (agent_handle, run_id, turn_number),
-        ).fetchone()
-
-        if row is None:
-            # this isn't supposed to happen, so we want to raise an error if it does.
-            raise ValueError(
-                f"Generated feed not found for agent {agent_handle}, run {run_id}, turn {turn_number}"
-            )
-
-        # Validate required fields are not NULL
-        context = f"generated feed agent_handle={agent_handle}, run_id={run_id}, turn_number={turn_number}"
-        _validate_generated_feed_row(row, context=context)
-
-        return GeneratedFeed(
-            feed_id=row["feed_id"],
-            run_id=row["run_id"],
-            turn_number=row["turn_number"],
-            agent_handle=row["agent_handle"],
-            post_uris=json.loads(row["post_uris"]),
-            created_at=row["created_at"],
+    row = (
+        _lookup_cursor()
+        .execute(_SELECT_GENERATED_FEED_BY_KEY, (agent_handle, run_id, turn_number))
+        .fetchone()
+    )
+
+    if row is None:
+        # this isn't supposed to happen, so we want to raise an error if it does.
+        raise ValueError(
+            f"Generated feed not found for agent {agent_handle}, run {run_id}, turn {turn_number}"
         )
 
+    return _row_to_generated_feed(row)
 
-def _validate_generated_feed_row(row: sqlite3.Row, context: str | None = None) -> None:
-    """Validate that all required generated feed fields are not NULL.
+
+def read_profile(handle: str) -> Optional[BlueskyProfile]:
+    """Read a Bluesky profile by handle.
+
+    INTERNAL: This function is an implementation detail used by SQLiteProfileAdapter.
+    External code should use ProfileRepository.get_profile() instead.
 
     Args:
-        row: SQLite Row object containing generated feed data
-        context: Optional context string to include in error messages
-                 (e.g., "generated feed agent_handle=user.bsky.social, run_id=...")
+        handle: Profile handle to look up
+
+    Returns:
+        BlueskyProfile if found, None otherwise
 
     Raises:
-        ValueError: If any required field is NULL. Error message includes
-                    the field name and optional context.
+        ValueError: If the profile data is invalid (NULL fields)
+        sqlite3.OperationalError: If database operation fails
     """
-    required_fields = [
-        "feed_id",
-        "run_id",
-        "turn_number",
-        "agent_handle",
-        "post_uris",
-        "created_at",
-    ]
+    cursor = _lookup_cursor()
+    use_cache = _read_caches_usable(cursor)
+    if use_cache:
+        cached = _PROFILE_CACHE.get(handle)
+        if cached is not None:
+            return cached
+        generation = _PROFILE_CACHE.generation()
+
+    row = cursor.execute(_SELECT_PROFILE_BY_HANDLE, (handle,)).fetchone()
+
+    if row is None:
+        return None
 
-    for field in required_fields:
-        if row[field] is None:
-            error_msg = f"{field} cannot be NULL"
-            if context:
-                error_msg = f"{error_msg} (context: {context})"
-            raise ValueError(error_msg)
+    profile = _row_to_profile(row)
+    if use_cache:
+        _PROFILE_CACHE.put(handle, profile, generation)
+    return profile
 
 
-def _validate_feed_post_row(row: sqlite3.Row, context: str | None = None) -> None:
-    """Validate that all required feed post fields are not NULL.
+def read_profiles_by_handles(handles: Iterable[str]) -> list[BlueskyProfile]:
+    """Read Bluesky profiles for a collection of handles.
+
+    INTERNAL: This function is an implementation detail used by SQLiteProfileAdapter.
+    External code should use ProfileRepository.get_profiles_by_handles() instead.
+
+    Looks the handles up with `WHERE handle IN (...)` queries of at most
+    _MAX_IN_PARAMS handles each, rather than one point query per handle.
 
     Args:
-        row: SQLite Row object containing feed post data
-        context: Optional context string to include in error messages
-                 (e.g., "feed post uri=at://did:plc:.../app.bsky.feed.post/...")
+        handles: Iterable of profile handles to look up
+
+    Returns:
+        List of BlueskyProfile models in the order of `handles` (first
+        occurrence of each handle). Handles with no stored profile are
+        silently skipped. Returns empty list if no handles are provided.
 
     Raises:
-        ValueError: If any required field is NULL. Error message includes
-                    the field name and optional context.
+        ValueError: If any profile data is invalid (NULL fields)
+        sqlite3.OperationalError: If database operation fails
     """
-    required_fields = [
-        "uri",
-        "author_display_name",
-        "author_handle",
-        "text",
-        "bookmark_count",
-        "like_count",
-        "quote_count",
-        "reply_count",
-        "repost_count",
-        "created_at",
+    # dict.fromkeys dedupes while keeping the caller's order.
+    unique_handles = list(dict.fromkeys(handles))
+    if not unique_handles:
+        return []
+
+    conn = get_connection()
+    profile_by_handle: dict[str, BlueskyProfile] = {}
+    for start in range(0, len(unique_handles), _MAX_IN_PARAMS):
+        chunk = unique_handles[start : start + _MAX_IN_PARAMS]
+        q_marks = ",".join("?" * len(chunk))
+        for row in conn.execute(
+            f"{_SELECT_PROFILES} WHERE handle IN ({q_marks})", chunk
+        ):
+            profile_by_handle[row[0]] = _row_to_profile(row)
+
+    return [
+        profile_by_handle[handle]
+        for handle in unique_handles
+        if handle in profile_by_handle
     ]
 
-    for field in required_fields:
-        if row[field] is None:
-            error_msg = f"{field} cannot be NULL"
-            if context:
-                error_msg = f"{error_msg} (context: {context})"
-            raise ValueError(error_msg)
 
+def iter_all_profiles(
+    batch_size: int = _ITER_BATCH_SIZE,
+) -> Iterator[BlueskyProfile]:
+    """Yield all Bluesky profiles from the database, one batch of rows at a time.
 
-def read_profile(handle: str) -> Optional[BlueskyProfile]:
-    """Read a Bluesky profile by handle.
-
-    INTERNAL: This function is an implementation detail used by SQLiteProfileAdapter.
-    External code should use ProfileRepository.get_profile() instead.
+    INTERNAL: This function is an implementation detail used by read_all_profiles().
 
     Args:
-        handle: Profile handle to look up
+        batch_size: Number of rows fetched from the cursor per round trip
 
-    Returns:
-        BlueskyProfile if found, None otherwise
+    Yields:
+        BlueskyProfile models, in table order
 
     Raises:
-        ValueError: If the profile data is invalid (NULL fields)
-        KeyError: If required columns are missing from the database row
+        ValueError: If any profile data is invalid (NULL fields)
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM bluesky_profiles WHERE handle = ?", (handle,)
-        ).fetchone()
-
-        if row is None:
-            return None
-
-        # Validate required fields are not NULL
-        if row["handle"] is None:
-            raise ValueError("handle cannot be NULL")
-        if row["did"] is None:
-            raise ValueError("did cannot be NULL")
-        if row["display_name"] is None:
-            raise ValueError("display_name cannot be NULL")
-        if row["bio"] is None:
-            raise ValueError("bio cannot be NULL")
-        if row["followers_count"] is None:
-            raise ValueError("followers_count cannot be NULL")
-        if row["follows_count"] is None:
-            raise ValueError("follows_count cannot be NULL")
-        if row["posts_count"] is None:
-            raise ValueError("posts_count cannot be NULL")
-
-        return BlueskyProfile(
-            handle=row["handle"],
-            did=row["did"],
-            display_name=row["display_name"],
-            bio=row["bio"],
-            followers_count=row["followers_count"],
-            follows_count=row["follows_count"],
-            posts_count=row["posts_count"],
-        )
+    # No `with` block: the connection context manager would commit on exit,
+    # which must not happen at an arbitrary point of a consumer's iteration.
+    cursor = get_connection().execute(_SELECT_PROFILES)
+    while rows := cursor.fetchmany(batch_size):
+        for row in rows:
+            yield _row_to_profile(row)
 
 
 def read_all_profiles() -> list[BlueskyProfile]:
@@ -547,43 +1267,9 @@ def read_all_profiles() -> list[BlueskyProfile]:
 
     Raises:
         ValueError: If any profile data is invalid (NULL fields)
-        KeyError: If required columns are missing from any database row
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
-        rows = conn.execute("SELECT * FROM bluesky_profiles").fetchall()
-
-        profiles = []
-        for row in rows:
-            # Validate required fields are not NULL
-            if row["handle"] is None:
-                raise ValueError("handle cannot be NULL")
-            if row["did"] is None:
-                raise ValueError("did cannot be NULL")
-            if row["display_name"] is None:
-                raise ValueError("display_name cannot be NULL")
-            if row["bio"] is None:
-                raise ValueError("bio cannot be NULL")
-            if row["followers_count"] is None:
-                raise ValueError("followers_count cannot be NULL")
-            if row["follows_count"] is None:
-                raise ValueError("follows_count cannot be NULL")
-            if row["posts_count"] is None:
-                raise ValueError("posts_count cannot be NULL")
-
-            profiles.append(
-                BlueskyProfile(
-                    handle=row["handle"],
-                    did=row["did"],
-                    display_name=row["display_name"],
-                    bio=row["bio"],
-                    followers_count=row["followers_count"],
-                    follows_count=row["follows_count"],
-                    posts_count=row["posts_count"],
-                )
-            )
-
-        return profiles
+    return list(iter_all_profiles())
 
 
 def read_feed_post(uri: str) -> BlueskyFeedPost:
@@ -601,37 +1287,28 @@ def read_feed_post(uri: str) -> BlueskyFeedPost:
     Raises:
         ValueError: If uri is empty or if no feed post is found for the given URI
         ValueError: If the feed post data is invalid (NULL fields)
-        KeyError: If required columns are missing from the database row
         sqlite3.OperationalError: If database operation fails
     """
     if not uri or not uri.strip():
         raise ValueError("uri cannot be empty")
 
-    with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM bluesky_feed_posts WHERE uri = ?", (uri,)
-        ).fetchone()
-
-        if row is None:
-            raise ValueError(f"No feed post found for uri: {uri}")
-
-        # Validate required fields are not NULL
-        context = f"feed post uri={uri}"
-        _validate_feed_post_row(row, context=context)
-
-        return BlueskyFeedPost(
-            id=row["uri"],
-            uri=row["uri"],
-            author_display_name=row["author_display_name"],
-            author_handle=row["author_handle"],
-            text=row["text"],
-            bookmark_count=row["bookmark_count"],
-            like_count=row["like_count"],
-            quote_count=row["quote_count"],
-            reply_count=row["reply_count"],
-            repost_count=row["repost_count"],
-            created_at=row["created_at"],
-        )
+    cursor = _lookup_cursor()
+    use_cache = _read_caches_usable(cursor)
+    if use_cache:
+        cached = _FEED_POST_CACHE.get(uri)
+        if cached is not None:
+            return cached
+        generation = _FEED_POST_CACHE.generation()
+
+    row = cursor.execute(_SELECT_FEED_POST_BY_URI, (uri,)).fetchone()
+
+    if row is None:
+        raise ValueError(f"No feed post found for uri: {uri}")
+
+    post = _row_to_feed_post(row)
+    if use_cache:
+        _FEED_POST_CACHE.put(uri, post, generation)
+    return post
 
 
 def read_feed_posts_by_author(author_handle: str) -> list[BlueskyFeedPost]:
@@ -648,43 +1325,39 @@ def read_feed_posts_by_author(author_handle: str) -> list[BlueskyFeedPost]:
 
     Raises:
         ValueError: If any feed post data is invalid (NULL fields)
-        KeyError: If required columns are missing from any database row
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
-        rows = conn.execute(
-            "SELECT * FROM bluesky_feed_posts WHERE author_handle = ?", (author_handle,)
-        ).fetchall()
+    rows = (
+        get_connection()
+        .execute(_SELECT_FEED_POSTS_BY_AUTHOR, (author_handle,))
+        .fetchall()
+    )
 
-        posts = []
-        for row in rows:
-            # Validate required fields are not NULL
-            # Try to get uri for context, fallback if uri itself is NULL
-            try:
-                uri_value = row["uri"] if row["uri"] is not None else "unknown"
-                context = f"feed post uri={uri_value}, author_handle={author_handle}"
-            except (KeyError, TypeError):
-                context = f"feed post (uri unavailable), author_handle={author_handle}"
-
-            _validate_feed_post_row(row, context=context)
-
-            posts.append(
-                BlueskyFeedPost(
-                    id=row["uri"],
-                    uri=row["uri"],
-                    author_display_name=row["author_display_name"],
-                    author_handle=row["author_handle"],
-                    text=row["text"],
-                    bookmark_count=row["bookmark_count"],
-                    like_count=row["like_count"],
-                    quote_count=row["quote_count"],
-                    reply_count=row["reply_count"],
-                    repost_count=row["repost_count"],
-                    created_at=row["created_at"],
-                )
-            )
+    context = f"author_handle={author_handle}"
+    return [_row_to_feed_post(row, context) for row in rows]
 
-        return posts
+
+def iter_all_feed_posts(
+    batch_size: int = _ITER_BATCH_SIZE,
+) -> Iterator[BlueskyFeedPost]:
+    """Yield all Bluesky feed posts from the database, one batch of rows at a time.
+
+    INTERNAL: This function is an implementation detail used by read_all_feed_posts().
+
+    Args:
+        batch_size: Number of rows fetched from the cursor per round trip
+
+    Yields:
+        BlueskyFeedPost models, in table order
+
+    Raises:
+        ValueError: If any feed post data is invalid (NULL fields)
+        sqlite3.OperationalError: If database operation fails
+    """
+    cursor = get_connection().execute(_SELECT_FEED_POSTS)
+    while rows := cursor.fetchmany(batch_size):
+        for row in rows:
+            yield _row_to_feed_post(row)
 
 
 def read_all_feed_posts() -> list[BlueskyFeedPost]:
@@ -698,67 +1371,43 @@ def read_all_feed_posts() -> list[BlueskyFeedPost]:
 
     Raises:
         ValueError: If any feed post data is invalid (NULL fields)
-        KeyError: If required columns are missing from any database row
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
-        rows = conn.execute("SELECT * FROM bluesky_feed_posts").fetchall()
+    return list(iter_all_feed_posts())
 
-        posts = []
-        for row in rows:
-            # Validate required fields are not NULL
-            # Try to get uri for context, fallback if uri itself is NULL
-            try:
-                uri_value = row["uri"] if row["uri"] is not None else "unknown"
-                context = f"feed post uri={uri_value}"
-            except (KeyError, TypeError):
-                context = "feed post (uri unavailable)"
-
-            _validate_feed_post_row(row, context=context)
-
-            posts.append(
-                BlueskyFeedPost(
-                    id=row["uri"],
-                    uri=row["uri"],
-                    author_display_name=row["author_display_name"],
-                    author_handle=row["author_handle"],
-                    text=row["text"],
-                    bookmark_count=row["bookmark_count"],
-                    like_count=row["like_count"],
-                    quote_count=row["quote_count"],
-                    reply_count=row["reply_count"],
-                    repost_count=row["repost_count"],
-                    created_at=row["created_at"],
-                )
-            )
 
-        return posts
+def read_feed_posts_page(limit: int, offset: int = 0) -> list[BlueskyFeedPost]:
+    """Read one page of Bluesky feed posts, ordered by URI.
 
+    INTERNAL: This function is an implementation detail used by SQLiteFeedPostAdapter.
+    External code should use FeedPostRepository.list_feed_posts_page() instead.
 
-def _validate_generated_bio_row(row: sqlite3.Row, context: str | None = None) -> None:
-    """Validate that all required generated bio fields are not NULL.
+    SQLite still steps over the `offset` skipped rows, so a page costs
+    O(offset + limit) and walking the whole table page by page is O(n^2).
+    Use iter_all_feed_posts() for a full walk.
 
     Args:
-        row: SQLite Row object containing generated bio data
-        context: Optional context string to include in error messages
-                 (e.g., "generated bio handle=user.bsky.social")
+        limit: Maximum number of posts to return
+        offset: Number of posts (in URI order) to skip
+
+    Returns:
+        Up to `limit` BlueskyFeedPost models. Returns empty list past the end.
 
     Raises:
-        ValueError: If any required field is NULL. Error message includes
-                    the field name and optional context.
+        ValueError: If limit or offset is negative, or if any feed post data
+            is invalid (NULL fields)
+        sqlite3.OperationalError: If database operation fails
     """
-    required_fields = [
-        "handle",
-        "generated_bio",
-        "created_at",
-    ]
+    if limit < 0:
+        raise ValueError("limit cannot be negative")
+    if offset < 0:
+        raise ValueError("offset cannot be negative")
+
+    # ORDER BY the primary key gives a stable page order and is served by
+    # the primary key index without a sort step.
+    rows = get_connection().execute(_SELECT_FEED_POSTS_PAGE, (limit, offset)).fetchall()
 
-    for field in required_fields:
-        if row[field] is None:
-            error_msg = f"{field} cannot be NULL"
-            if context:
-                error_msg = f"{error_msg} (context: {context})"
-            raise ValueError(error_msg)
+    return [_row_to_feed_post(row) for row in rows]
 
 
 def read_generated_bio(handle: str) -> Optional[GeneratedBio]:
@@ -775,32 +1424,39 @@ def read_generated_bio(handle: str) -> Optional[GeneratedBio]:
 
     Raises:
         ValueError: If the bio data is invalid (NULL fields)
-        KeyError: If required columns are missing from the database row
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM agent_bios WHERE handle = ?", (handle,)
-        ).fetchone()
-
-        if row is None:
-            return None
-
-        # Validate required fields are not NULL
-        context = f"generated bio handle={handle}"
-        _validate_generated_bio_row(row, context=context)
-
-        from simulation.core.models.generated.base import GenerationMetadata
-
-        return GeneratedBio(
-            handle=row["handle"],
-            generated_bio=row["generated_bio"],
-            metadata=GenerationMetadata(
-                model_used=None,
-                generation_metadata=None,
-                created_at=row["created_at"],
-            ),
-        )
+    row = (
+        _lookup_cursor().execute(_SELECT_GENERATED_BIO_BY_HANDLE, (handle,)).fetchone()
+    )
+
+    if row is None:
+        return None
+
+    return _row_to_generated_bio(row)
+
+
+def iter_all_generated_bios(
+    batch_size: int = _ITER_BATCH_SIZE,
+) -> Iterator[GeneratedBio]:
+    """Yield all generated bios from the database, one batch of rows at a time.
+
+    INTERNAL: This function is an implementation detail used by read_all_generated_bios().
+
+    Args:
+        batch_size: Number of rows fetched from the cursor per round trip
+
+    Yields:
+        GeneratedBio models, in table order
+
+    Raises:
+        ValueError: If any bio data is invalid (NULL fields)
+        sqlite3.OperationalError: If database operation fails
+    """
+    cursor = get_connection().execute(_SELECT_GENERATED_BIOS)
+    while rows := cursor.fetchmany(batch_size):
+        for row in rows:
+            yield _row_to_generated_bio(row)
 
 
 def read_all_generated_bios() -> list[GeneratedBio]:
@@ -814,34 +1470,32 @@ def read_all_generated_bios() -> list[GeneratedBio]:
 
     Raises:
         ValueError: If any bio data is invalid (NULL fields)
-        KeyError: If required columns are missing from any database row
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
-        rows = conn.execute("SELECT * FROM agent_bios").fetchall()
+    return list(iter_all_generated_bios())
 
-        bios = []
-        for row in rows:
-            # Validate required fields are not NULL
-            handle_value = row["handle"] if row["handle"] is not None else "unknown"
-            context = f"generated bio handle={handle_value}"
-            _validate_generated_bio_row(row, context=context)
-
-            from simulation.core.models.generated.base import GenerationMetadata
-
-            bios.append(
-                GeneratedBio(
-                    handle=row["handle"],
-                    generated_bio=row["generated_bio"],
-                    metadata=GenerationMetadata(
-                        model_used=None,
-                        generation_metadata=None,
-                        created_at=row["created_at"],
-                    ),
-                )
-            )
 
-        return bios
+def iter_all_generated_feeds(
+    batch_size: int = _ITER_BATCH_SIZE,
+) -> Iterator[GeneratedFeed]:
+    """Yield all generated feeds from the database, one batch of rows at a time.
+
+    INTERNAL: This function is an implementation detail used by read_all_generated_feeds().
+
+    Args:
+        batch_size: Number of rows fetched from the cursor per round trip
+
+    Yields:
+        GeneratedFeed models, in table order
+
+    Raises:
+        ValueError: If any feed data is invalid (NULL fields)
+        sqlite3.OperationalError: If database operation fails
+    """
+    cursor = get_connection().execute(_SELECT_GENERATED_FEEDS)
+    while rows := cursor.fetchmany(batch_size):
+        for row in rows:
+            yield _row_to_generated_feed(row)
 
 
 def read_all_generated_feeds() -> list[GeneratedFeed]:
@@ -855,44 +1509,9 @@ def read_all_generated_feeds() -> list[GeneratedFeed]:
 
     Raises:
         ValueError: If any feed data is invalid (NULL fields)
-        KeyError: If required columns are missing from any database row
         sqlite3.OperationalError: If database operation fails
     """
-    with get_connection() as conn:
-        rows = conn.execute("SELECT * FROM generated_feeds").fetchall()
-
-        feeds = []
-        for row in rows:
-            # Validate required fields are not NULL
-            # Try to get identifying info for context, fallback if unavailable
-            try:
-                agent_handle_value = (
-                    row["agent_handle"]
-                    if row["agent_handle"] is not None
-                    else "unknown"
-                )
-                run_id_value = row["run_id"] if row["run_id"] is not None else "unknown"
-                turn_number_value = (
-                    row["turn_number"] if row["turn_number"] is not None else "unknown"
-                )
-                context = f"generated feed agent_handle={agent_handle_value}, run_id={run_id_value}, turn_number={turn_number_value}"
-            except (KeyError, TypeError):
-                context = "generated feed (identifying info unavailable)"
-
-            _validate_generated_feed_row(row, context=context)
-
-            feeds.append(
-                GeneratedFeed(
-                    feed_id=row["feed_id"],
-                    run_id=row["run_id"],
-                    turn_number=row["turn_number"],
-                    agent_handle=row["agent_handle"],
-                    post_uris=json.loads(row["post_uris"]),
-                    created_at=row["created_at"],
-                )
-            )
-
-        return feeds
+    return list(iter_all_generated_feeds())
 
 
 def read_post_uris_for_run(agent_handle: str, run_id: str) -> set[str]:
@@ -911,70 +1530,65 @@ def read_post_uris_for_run(agent_handle: str, run_id: str) -> set[str]:
 
     Raises:
         ValueError: If agent_handle or run_id is empty
-        sqlite3.OperationalError: If database operation fails
+        sqlite3.OperationalError: If database operation fails or a stored
+            post_uris value is malformed JSON
     """
     if not agent_handle or not agent_handle.strip():
         raise ValueError("agent_handle cannot be empty")
     if not run_id or not run_id.strip():
         raise ValueError("run_id cannot be empty")
 
-    with get_connection() as conn:
-        rows = conn.execute(
-            """
-            SELECT post_uris
-            FROM generated_feeds
-            WHERE agent_handle = ? AND run_id = ?
-        """,
-            (agent_handle, run_id),
-        ).fetchall()
-        return {uri for row in rows for uri in json.loads(row["post_uris"])}
+    # Expand and dedupe the JSON arrays inside SQLite rather than decoding
+    # every feed's post_uris in Python and unioning the lists.
+    rows = (
+        get_connection()
+        .execute(_SELECT_RUN_POST_URIS, (agent_handle, run_id))
+        .fetchall()
+    )
+    return {row[0] for row in rows}
 
 
-def _row_to_run(row: sqlite3.Row) -> Run:
-    """Convert a database row to a Run model.
+def _row_to_run(row: Sequence) -> Run:
+    """Convert a runs row to a Run model.
 
     Args:
-        row: SQLite Row object containing run data
+        row: Row values selected with _SELECT_RUNS
 
     Returns:
         Run model instance
 
     Raises:
-        ValueError: If required fields are NULL or status is invalid
-        KeyError: If required columns are missing from row
+        ValueError: If the row has the wrong number of columns, required
+            fields are NULL or status is invalid
     """
-    from simulation.core.models.runs import RunStatus
-
-    # Validate required fields are not NULL
-    if row["run_id"] is None:
-        raise ValueError("run_id cannot be NULL")
-    if row["created_at"] is None:
-        raise ValueError("created_at cannot be NULL")
-    if row["total_turns"] is None:
-        raise ValueError("total_turns cannot be NULL")
-    if row["total_agents"] is None:
-        raise ValueError("total_agents cannot be NULL")
-    if row["started_at"] is None:
-        raise ValueError("started_at cannot be NULL")
-    if row["status"] is None:
-        raise ValueError("status cannot be NULL")
-
-    # Convert status string to RunStatus enum, handling invalid values
-    try:
-        status = RunStatus(row["status"])
-    except ValueError as err:
+    _check_column_count(row, _RUN_COLUMNS, "runs")
+    # completed_at is the trailing column, so the required prefix is checked
+    _validate_not_null(row[:-1], _RUN_REQUIRED_COLUMNS)
+
+    (
+        run_id,
+        created_at,
+        total_turns,
+        total_agents,
+        started_at,
+        status_value,
+        completed_at,
+    ) = row
+
+    status = _RUN_STATUS_BY_VALUE.get(status_value)
+    if status is None:
         raise ValueError(
-            f"Invalid status value: {row['status']}. Must be one of: {[s.value for s in RunStatus]}"
-        ) from err
+            f"Invalid status value: {status_value}. Must be one of: {list(_RUN_STATUS_BY_VALUE)}"
+        )
 
     return Run(
-        run_id=row["run_id"],
-        created_at=row["created_at"],
-        total_turns=row["total_turns"],
-        total_agents=row["total_agents"],
-        started_at=row["started_at"],
+        run_id=run_id,
+        created_at=created_at,
+        total_turns=total_turns,
+        total_agents=total_agents,
+        started_at=started_at,
         status=status,
-        completed_at=row["completed_at"],
+        completed_at=completed_at,
     )
 
 
@@ -993,15 +1607,34 @@ def read_run(run_id: str) -> Optional[Run]:
     Raises:
         ValueError: If the run data is invalid (NULL fields, invalid status)
         sqlite3.OperationalError: If database operation fails
-        KeyError: If required columns are missing from the database row
     """
-    with get_connection() as conn:
-        row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+    row = _lookup_cursor().execute(_SELECT_RUN_BY_ID, (run_id,)).fetchone()
 
-        if row is None:
-            return None
+    if row is None:
+        return None
 
-        return _row_to_run(row)
+    return _row_to_run(row)
+
+
+def iter_all_runs(batch_size: int = _ITER_BATCH_SIZE) -> Iterator[Run]:
+    """Yield all runs, newest first, one batch of rows at a time.
+
+    INTERNAL: This function is an implementation detail used by read_all_runs().
+
+    Args:
+        batch_size: Number of rows fetched from the cursor per round trip
+
+    Yields:
+        Run models, ordered by created_at descending (newest first)
+
+    Raises:
+        ValueError: If any run data is invalid (NULL fields, invalid status)
+        sqlite3.OperationalError: If database operation fails
+    """
+    cursor = get_connection().execute(_SELECT_RUNS_NEWEST_FIRST)
+    while rows := cursor.fetchmany(batch_size):
+        for row in rows:
+            yield _row_to_run(row)
 
 
 def read_all_runs() -> list[Run]:
@@ -1017,12 +1650,8 @@ def read_all_runs() -> list[Run]:
     Raises:
         ValueError: If any run data is invalid (NULL fields, invalid status)
         sqlite3.OperationalError: If database operation fails
-        KeyError: If required columns are missing from any database row
     """
-    with get_connection() as conn:
-        rows = conn.execute("SELECT * FROM runs ORDER BY created_at DESC").fetchall()
-
-        return [_row_to_run(row) for row in rows]
+    return list(iter_all_runs())
 
 
 def update_run_status(
@@ -1044,15 +1673,7 @@ def update_run_status(
         sqlite3.OperationalError: If database operation fails
         sqlite3.IntegrityError: If status value violates CHECK constraints
     """
-    with get_connection() as conn:
-        cursor = conn.execute(
-            """
-            UPDATE runs 
-            SET status = ?, completed_at = ?
-            WHERE run_id = ?
-        """,
-            (status, completed_at, run_id),
-        )
+    with transaction() as conn:
+        cursor = conn.execute(_UPDATE_RUN_STATUS, (status, completed_at, run_id))
         if cursor.rowcount == 0:
             raise RunNotFoundError(run_id)
-        conn.commit()
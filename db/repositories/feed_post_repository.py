@@ -72,6 +72,21 @@ class FeedPostRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def list_feed_posts_page(
+        self, limit: int, offset: int = 0
+    ) -> list[BlueskyFeedPost]:
+        """List one page of feed posts.
+
+        Args:
+            limit: Maximum number of posts to return
+            offset: Number of posts to skip
+
+        Returns:
+            Up to `limit` BlueskyFeedPost models, in a stable order.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def read_feed_posts_by_uris(self, uris: Iterable[str]) -> list[BlueskyFeedPost]:
         """Read feed posts by URIs.
@@ -201,6 +216,27 @@ class SQLiteFeedPostRepository(FeedPostRepository):
         """
         return self._db_adapter.read_all_feed_posts()
 
+    def list_feed_posts_page(
+        self, limit: int, offset: int = 0
+    ) -> list[BlueskyFeedPost]:
+        """List one page of feed posts from SQLite, ordered by URI.
+
+        Meant for showing a page of posts, not for walking the whole table:
+        each page re-reads the `offset` rows it skips, so paging through n
+        posts costs O(n^2) row reads.
+
+        Args:
+            limit: Maximum number of posts to return
+            offset: Number of posts to skip
+
+        Returns:
+            Up to `limit` BlueskyFeedPost models. Returns empty list past the end.
+
+        Raises:
+            ValueError: If limit or offset is negative (from adapter)
+        """
+        return self._db_adapter.read_feed_posts_page(limit, offset)
+
     def read_feed_posts_by_uris(self, uris: Iterable[str]) -> list[BlueskyFeedPost]:
         """Read feed posts by URIs from SQLite.
 
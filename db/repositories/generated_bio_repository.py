@@ -22,6 +22,20 @@ class GeneratedBioRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def create_or_update_generated_bios(
+        self, bios: list[GeneratedBio]
+    ) -> list[GeneratedBio]:
+        """Create or update multiple generated bios (batch operation).
+
+        Args:
+            bios: List of GeneratedBio models to create or update
+
+        Returns:
+            List of created or updated GeneratedBio objects
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_generated_bio(self, handle: str) -> Optional[GeneratedBio]:
         """Get a generated bio by handle.
@@ -77,6 +91,30 @@ class SQLiteGeneratedBioRepository(GeneratedBioRepository):
         self._db_adapter.write_generated_bio(bio)
         return bio
 
+    def create_or_update_generated_bios(
+        self, bios: list[GeneratedBio]
+    ) -> list[GeneratedBio]:
+        """Create or update multiple generated bios in SQLite (batch operation).
+
+        Args:
+            bios: List of GeneratedBio models to create or update.
+                  None is not allowed. Empty list is allowed and will result
+                  in no database operations.
+
+        Returns:
+            List of created or updated GeneratedBio objects
+
+        Raises:
+            ValueError: If bios is None
+            sqlite3.IntegrityError: If any handle violates constraints (from adapter)
+            sqlite3.OperationalError: If database operation fails (from adapter)
+        """
+        if bios is None:
+            raise ValueError("bios cannot be None")
+
+        self._db_adapter.write_generated_bios(bios)
+        return bios
+
     def get_generated_bio(self, handle: str) -> Optional[GeneratedBio]:
         """Get a generated bio from SQLite.
 
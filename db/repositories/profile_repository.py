@@ -1,7 +1,7 @@
 """Abstraction for profile repositories."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Optional
 
 from db.adapters.base import ProfileDatabaseAdapter
 from simulation.core.models.profiles import BlueskyProfile
@@ -22,6 +22,20 @@ class ProfileRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def create_or_update_profiles(
+        self, profiles: list[BlueskyProfile]
+    ) -> list[BlueskyProfile]:
+        """Create or update multiple profiles (batch operation).
+
+        Args:
+            profiles: List of BlueskyProfile models to create or update
+
+        Returns:
+            List of created or updated BlueskyProfile objects
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_profile(self, handle: str) -> Optional[BlueskyProfile]:
         """Get a profile by handle.
@@ -34,6 +48,19 @@ class ProfileRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_profiles_by_handles(self, handles: Iterable[str]) -> list[BlueskyProfile]:
+        """Get profiles for a collection of handles.
+
+        Args:
+            handles: Iterable of profile handles to look up
+
+        Returns:
+            List of BlueskyProfile models in the order of `handles`.
+            Handles with no stored profile are skipped.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def list_profiles(self) -> list[BlueskyProfile]:
         """List all profiles.
@@ -77,6 +104,31 @@ class SQLiteProfileRepository(ProfileRepository):
         self._db_adapter.write_profile(profile)
         return profile
 
+    def create_or_update_profiles(
+        self, profiles: list[BlueskyProfile]
+    ) -> list[BlueskyProfile]:
+        """Create or update multiple profiles in SQLite (batch operation).
+
+        Args:
+            profiles: List of BlueskyProfile models to create or update.
+                      None is not allowed. Empty list is allowed and will result
+                      in no database operations.
+
+        Returns:
+            List of created or updated BlueskyProfile objects
+
+        Raises:
+            ValueError: If profiles is None or if any handle is empty (validated by Pydantic models)
+            sqlite3.IntegrityError: If any handle violates constraints (from adapter)
+            sqlite3.OperationalError: If database operation fails (from adapter)
+        """
+        if profiles is None:
+            raise ValueError("profiles cannot be None")
+
+        # Validation is handled by Pydantic models (BlueskyProfile.validate_handle)
+        self._db_adapter.write_profiles(profiles)
+        return profiles
+
     def get_profile(self, handle: str) -> Optional[BlueskyProfile]:
         """Get a profile from SQLite.
 
@@ -97,6 +149,30 @@ class SQLiteProfileRepository(ProfileRepository):
             raise ValueError("handle cannot be empty")
         return self._db_adapter.read_profile(handle)
 
+    def get_profiles_by_handles(self, handles: Iterable[str]) -> list[BlueskyProfile]:
+        """Get profiles for a collection of handles from SQLite.
+
+        Prefer this over calling get_profile() in a loop: the lookups are
+        batched into a few queries instead of one per handle.
+
+        Args:
+            handles: Iterable of profile handles to look up
+
+        Returns:
+            List of BlueskyProfile models in the order of `handles`.
+            Returns empty list if no handles are provided or none are found.
+            Handles with no stored profile are silently skipped.
+
+        Raises:
+            ValueError: If any handle is empty or None
+        """
+        handles = list(handles)
+        if any(not handle or not handle.strip() for handle in handles):
+            raise ValueError("handle cannot be empty")
+        if not handles:
+            return []
+        return self._db_adapter.read_profiles_by_handles(handles)
+
     def list_profiles(self) -> list[BlueskyProfile]:
         """List all profiles from SQLite.
 
@@ -62,6 +62,21 @@ class RunRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def list_turn_metadata(self, run_id: str) -> list[TurnMetadata]:
+        """List turn metadata for every turn of a run.
+
+        Args:
+            run_id: The ID of the run
+
+        Returns:
+            List of TurnMetadata ordered by turn_number
+
+        Raises:
+            ValueError: If run_id is empty
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def write_turn_metadata(self, turn_metadata: TurnMetadata) -> None:
         """Write turn metadata to the database.
@@ -229,6 +244,29 @@ class SQLiteRunRepository(RunRepository):
 
         return self._db_adapter.read_turn_metadata(run_id, turn_number)
 
+    def list_turn_metadata(self, run_id: str) -> list[TurnMetadata]:
+        """List turn metadata for every turn of a run.
+
+        Uses a single adapter read instead of one read per turn.
+
+        Args:
+            run_id: The ID of the run
+
+        Returns:
+            List of TurnMetadata ordered by turn_number. Returns empty list if
+            the run has no turn metadata.
+
+        Raises:
+            ValueError: If run_id is empty
+            ValueError: If the turn metadata data is invalid
+            KeyError: If required columns are missing from the database row
+            Exception: Database-specific exceptions from the adapter
+        """
+        if not run_id or not run_id.strip():
+            raise ValueError("run_id cannot be empty")
+
+        return self._db_adapter.read_turn_metadata_for_run(run_id)
+
     def write_turn_metadata(self, turn_metadata: TurnMetadata) -> None:
         """Write turn metadata to the database.
 
@@ -6,7 +6,7 @@ For now, what this looks like is:
 - Persisting the agent to the SQLite database.
 """
 
-from db.db import initialize_database
+from db.db import initialize_database, transaction
 from db.repositories.feed_post_repository import create_sqlite_feed_post_repository
 from db.repositories.profile_repository import create_sqlite_profile_repository
 from lib.bluesky_client import BlueskyClient
@@ -96,9 +96,12 @@ def main():
         profile_info = get_bsky_profile_information(handle)
 
         profile = transform_bsky_profile(profile_info["profile"])
-        profile_repo.create_or_update_profile(profile)
         feed_posts = transform_bsky_author_feed(profile_info["author_feed"])
-        feed_post_repo.create_or_update_feed_posts(feed_posts)
+        # Write the profile and its posts as one unit: both writes join this
+        # transaction, so they commit once and a failure leaves neither.
+        with transaction():
+            profile_repo.create_or_update_profile(profile)
+            feed_post_repo.create_or_update_feed_posts(feed_posts)
 
         print(f"Profile information for {handle} written to database.")
 
@@ -92,6 +92,19 @@ class SimulationEngine:
             raise ValueError("turn_number cannot be negative")
         return self.run_repo.get_turn_metadata(run_id, turn_number)
 
+    def list_turn_metadata(self, run_id: str) -> list[TurnMetadata]:
+        """List turn metadata for every turn of a run.
+
+        Args:
+            run_id: The ID of the run.
+
+        Returns:
+            The turn metadata for the run, ordered by turn number.
+        """
+        if not run_id or not run_id.strip():
+            raise ValueError("run_id cannot be empty")
+        return self.run_repo.list_turn_metadata(run_id)
+
     def get_turn_data(self, run_id: str, turn_number: int) -> Optional[TurnData]:
         """Returns full turn data with feeds and posts.
 
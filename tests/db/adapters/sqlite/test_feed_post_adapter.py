@@ -16,19 +16,16 @@ def adapter():
     return SQLiteFeedPostAdapter()
 
 
-def create_mock_row(row_data: dict) -> MagicMock:
-    """Helper function to create a mock sqlite3.Row.
+def create_mock_row(row_data: dict) -> tuple:
+    """Helper function to create a positional row as returned by the explicit SELECT.
 
     Args:
-        row_data: Dictionary mapping column names to values
+        row_data: Dictionary mapping column names to values, in table column order
 
     Returns:
-        MagicMock configured to behave like a sqlite3.Row
+        Tuple of the values, which behaves like a sqlite3.Row under positional access
     """
-    mock_row = MagicMock()
-    mock_row.__getitem__ = Mock(side_effect=lambda key: row_data[key])
-    mock_row.keys = Mock(return_value=list(row_data.keys()))
-    return mock_row
+    return tuple(row_data.values())
 
 
 @pytest.fixture
@@ -286,10 +283,10 @@ class TestSQLiteFeedPostAdapterReadFeedPostsByUris:
             with pytest.raises(sqlite3.OperationalError, match="Database error"):
                 adapter.read_feed_posts_by_uris(uris)
 
-    def test_raises_keyerror_when_missing_required_column(
+    def test_raises_valueerror_when_missing_required_column(
         self, adapter, mock_db_connection
     ):
-        """Test that read_feed_posts_by_uris raises KeyError when required column is missing."""
+        """Test that read_feed_posts_by_uris raises ValueError when a column is missing from the row."""
         # Arrange
         uris = ["uri1"]
 
@@ -311,7 +308,9 @@ class TestSQLiteFeedPostAdapterReadFeedPostsByUris:
             mock_cursor.fetchall = Mock(return_value=[mock_row])
 
             # Act & Assert
-            with pytest.raises(KeyError):
+            with pytest.raises(
+                ValueError, match="bluesky_feed_posts row has 9 columns, expected 10"
+            ):
                 adapter.read_feed_posts_by_uris(uris)
 
     def test_raises_valueerror_when_null_fields(self, adapter, mock_db_connection):
@@ -23,19 +23,16 @@ def default_test_data():
     return {"run_id": "run_123", "turn_number": 0, "agent_handle": "agent.bsky.social"}
 
 
-def create_mock_row(row_data: dict) -> MagicMock:
-    """Helper function to create a mock sqlite3.Row.
+def create_row(row_data: dict) -> tuple:
+    """Helper function to create a positional row as returned by the cursor.
 
     Args:
-        row_data: Dictionary mapping column names to values
+        row_data: Dictionary mapping column names to values, in SELECT order
 
     Returns:
-        MagicMock configured to behave like a sqlite3.Row
+        Tuple of the row values in insertion order
     """
-    mock_row = MagicMock()
-    mock_row.__getitem__ = Mock(side_effect=lambda key: row_data[key])
-    mock_row.keys = Mock(return_value=list(row_data.keys()))
-    return mock_row
+    return tuple(row_data.values())
 
 
 @pytest.fixture
@@ -44,7 +41,7 @@ def mock_db_connection():
 
     Usage:
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
-            mock_cursor.fetchall = Mock(return_value=[row1, row2])
+            mock_cursor.__iter__.return_value = iter([row1, row2])
             # test code here
     """
 
@@ -97,11 +94,11 @@ class TestSQLiteGeneratedFeedAdapterReadFeedsForTurn:
             "post_uris": json.dumps(post_uris_2),
             "created_at": "2024_01_01-12:00:01",
         }
-        mock_row_1 = create_mock_row(row_data_1)
-        mock_row_2 = create_mock_row(row_data_2)
+        mock_row_1 = create_row(row_data_1)
+        mock_row_2 = create_row(row_data_2)
 
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
-            mock_cursor.fetchall = Mock(return_value=[mock_row_1, mock_row_2])
+            mock_cursor.__iter__.return_value = iter([mock_row_1, mock_row_2])
 
             # Act
             result = adapter.read_feeds_for_turn(run_id, turn_number)
@@ -118,7 +115,8 @@ class TestSQLiteGeneratedFeedAdapterReadFeedsForTurn:
 
             # Verify database was called with correct parameters
             mock_conn.execute.assert_called_once_with(
-                "SELECT * FROM generated_feeds WHERE run_id = ? AND turn_number = ?",
+                "SELECT feed_id, run_id, turn_number, agent_handle, post_uris, "
+                "created_at FROM generated_feeds WHERE run_id = ? AND turn_number = ?",
                 (run_id, turn_number),
             )
 
@@ -131,7 +129,7 @@ class TestSQLiteGeneratedFeedAdapterReadFeedsForTurn:
         turn_number = default_test_data["turn_number"]
 
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
-            mock_cursor.fetchall = Mock(return_value=[])
+            mock_cursor.__iter__.return_value = iter([])
 
             # Act
             result = adapter.read_feeds_for_turn(run_id, turn_number)
@@ -156,10 +154,10 @@ class TestSQLiteGeneratedFeedAdapterReadFeedsForTurn:
             with pytest.raises(sqlite3.OperationalError, match="Database error"):
                 adapter.read_feeds_for_turn(run_id, turn_number)
 
-    def test_raises_keyerror_when_missing_required_column(
+    def test_raises_valueerror_when_missing_required_column(
         self, adapter, default_test_data, mock_db_connection
     ):
-        """Test that read_feeds_for_turn raises KeyError when required column is missing."""
+        """Test that read_feeds_for_turn raises ValueError when a row has too few columns."""
         # Arrange
         run_id = default_test_data["run_id"]
         turn_number = default_test_data["turn_number"]
@@ -172,13 +170,15 @@ class TestSQLiteGeneratedFeedAdapterReadFeedsForTurn:
             "post_uris": json.dumps(["uri1"]),
             "created_at": "2024_01_01-12:00:00",
         }
-        mock_row = create_mock_row(row_data)
+        mock_row = create_row(row_data)
 
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
-            mock_cursor.fetchall = Mock(return_value=[mock_row])
+            mock_cursor.__iter__.return_value = iter([mock_row])
 
             # Act & Assert
-            with pytest.raises(KeyError):
+            with pytest.raises(
+                ValueError, match="generated_feeds row has 5 columns, expected 6"
+            ):
                 adapter.read_feeds_for_turn(run_id, turn_number)
 
     def test_raises_valueerror_when_null_fields(
@@ -198,10 +198,10 @@ class TestSQLiteGeneratedFeedAdapterReadFeedsForTurn:
             "post_uris": json.dumps(["uri1"]),
             "created_at": "2024_01_01-12:00:00",
         }
-        mock_row = create_mock_row(row_data)
+        mock_row = create_row(row_data)
 
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
-            mock_cursor.fetchall = Mock(return_value=[mock_row])
+            mock_cursor.__iter__.return_value = iter([mock_row])
 
             # Act & Assert
             with pytest.raises(ValueError, match="feed_id cannot be NULL"):
@@ -224,13 +224,13 @@ class TestSQLiteGeneratedFeedAdapterReadFeedsForTurn:
             "post_uris": "not valid json",
             "created_at": "2024_01_01-12:00:00",
         }
-        mock_row = create_mock_row(row_data)
+        mock_row = create_row(row_data)
 
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
-            mock_cursor.fetchall = Mock(return_value=[mock_row])
+            mock_cursor.__iter__.return_value = iter([mock_row])
 
             # Act & Assert
-            with pytest.raises(json.JSONDecodeError):
+            with pytest.raises(ValueError):
                 adapter.read_feeds_for_turn(run_id, turn_number)
 
     def test_calls_database_with_correct_parameters(
@@ -242,7 +242,7 @@ class TestSQLiteGeneratedFeedAdapterReadFeedsForTurn:
         turn_number = default_test_data["turn_number"]
 
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
-            mock_cursor.fetchall = Mock(return_value=[])
+            mock_cursor.__iter__.return_value = iter([])
 
             # Act
             adapter.read_feeds_for_turn(run_id, turn_number)
@@ -250,8 +250,36 @@ class TestSQLiteGeneratedFeedAdapterReadFeedsForTurn:
             # Assert
             mock_conn.execute.assert_called_once()
             call_args = mock_conn.execute.call_args
-            assert (
-                call_args[0][0]
-                == "SELECT * FROM generated_feeds WHERE run_id = ? AND turn_number = ?"
+            assert call_args[0][0] == (
+                "SELECT feed_id, run_id, turn_number, agent_handle, post_uris, "
+                "created_at FROM generated_feeds WHERE run_id = ? AND turn_number = ?"
             )
             assert call_args[0][1] == (run_id, turn_number)
+
+
+def make_feed(agent_handle: str = "agent.bsky.social") -> GeneratedFeed:
+    """Helper factory to create GeneratedFeed instances for testing."""
+    return GeneratedFeed(
+        feed_id=f"feed_{agent_handle}",
+        run_id="run_123",
+        turn_number=0,
+        agent_handle=agent_handle,
+        post_uris=["uri1", "uri2"],
+        created_at="2024_01_01-12:00:00",
+    )
+
+
+class TestSQLiteGeneratedFeedAdapterWriteGeneratedFeeds:
+    """Tests for SQLiteGeneratedFeedAdapter.write_generated_feeds method."""
+
+    def test_writes_feeds_in_one_batch(self, adapter):
+        """Test that write_generated_feeds hands every feed to one batch write."""
+        # Arrange
+        feeds = [make_feed("agent1.bsky.social"), make_feed("agent2.bsky.social")]
+
+        with patch("db.db.write_generated_feeds") as mock_write:
+            # Act
+            adapter.write_generated_feeds(feeds)
+
+            # Assert
+            mock_write.assert_called_once_with(feeds)
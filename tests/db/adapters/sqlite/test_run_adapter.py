@@ -333,6 +333,97 @@ class TestSQLiteRunAdapterReadTurnMetadata:
             assert call_args[0][1] == (run_id, turn_number)
 
 
+class TestSQLiteRunAdapterReadTurnMetadataForRun:
+    """Tests for SQLiteRunAdapter.read_turn_metadata_for_run method."""
+
+    def test_returns_turn_metadata_for_all_turns(
+        self, adapter, default_test_data, mock_db_connection
+    ):
+        """Test that read_turn_metadata_for_run returns one TurnMetadata per row."""
+        # Arrange
+        run_id = default_test_data["run_id"]
+        rows = [
+            create_mock_row(
+                {
+                    "run_id": run_id,
+                    "turn_number": turn_number,
+                    "total_actions": json.dumps({"like": turn_number, "follow": 1}),
+                    "created_at": "2024_01_01-12:00:00",
+                }
+            )
+            for turn_number in range(3)
+        ]
+
+        with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
+            mock_cursor.__iter__.return_value = iter(rows)
+
+            # Act
+            result = adapter.read_turn_metadata_for_run(run_id)
+
+            # Assert
+            assert [m.turn_number for m in result] == [0, 1, 2]
+            assert all(isinstance(m, TurnMetadata) for m in result)
+            assert result[2].total_actions[TurnAction.LIKE] == 2
+            assert result[2].total_actions[TurnAction.FOLLOW] == 1
+            mock_conn.execute.assert_called_once_with(
+                "SELECT run_id, turn_number, total_actions, created_at "
+                "FROM turn_metadata WHERE run_id = ? ORDER BY turn_number",
+                (run_id,),
+            )
+
+    def test_returns_empty_list_when_no_rows(
+        self, adapter, default_test_data, mock_db_connection
+    ):
+        """Test that read_turn_metadata_for_run returns empty list when run has no turns."""
+        # Arrange
+        run_id = default_test_data["run_id"]
+
+        with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
+            mock_cursor.__iter__.return_value = iter([])
+
+            # Act
+            result = adapter.read_turn_metadata_for_run(run_id)
+
+            # Assert
+            assert result == []
+
+    def test_raises_valueerror_for_invalid_action_type(
+        self, adapter, default_test_data, mock_db_connection
+    ):
+        """Test that read_turn_metadata_for_run raises ValueError for invalid action keys."""
+        # Arrange
+        run_id = default_test_data["run_id"]
+        mock_row = create_mock_row(
+            {
+                "run_id": run_id,
+                "turn_number": 0,
+                "total_actions": json.dumps({"invalid_action": 1}),
+                "created_at": "2024_01_01-12:00:00",
+            }
+        )
+
+        with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
+            mock_cursor.__iter__.return_value = iter([mock_row])
+
+            # Act & Assert
+            with pytest.raises(ValueError, match="Invalid action type"):
+                adapter.read_turn_metadata_for_run(run_id)
+
+    def test_raises_operational_error_on_database_error(
+        self, adapter, default_test_data, mock_db_connection
+    ):
+        """Test that read_turn_metadata_for_run raises OperationalError on database errors."""
+        # Arrange
+        run_id = default_test_data["run_id"]
+
+        with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
+            mock_conn.execute.side_effect = sqlite3.OperationalError("Database locked")
+
+            # Act & Assert
+            with pytest.raises(sqlite3.OperationalError):
+                adapter.read_turn_metadata_for_run(run_id)
+
+
 class TestSQLiteRunAdapterWriteTurnMetadata:
     """Tests for SQLiteRunAdapter.write_turn_metadata method."""
 
@@ -355,18 +446,21 @@ class TestSQLiteRunAdapterWriteTurnMetadata:
             created_at="2024_01_01-12:00:00",
         )
 
-        # Mock read_turn_metadata to return None (no duplicate)
         adapter.read_turn_metadata = Mock(return_value=None)
 
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
+            mock_conn.in_transaction = False
+            mock_cursor.rowcount = 1
+
             # Act
             adapter.write_turn_metadata(turn_metadata)
 
             # Assert
-            # Verify read_turn_metadata was called to check for duplicates
-            adapter.read_turn_metadata.assert_called_once_with(run_id, turn_number)
-            # Verify INSERT was executed
-            mock_conn.execute.assert_called_once()
+            # Verify no read is issued to check for duplicates
+            adapter.read_turn_metadata.assert_not_called()
+            # Verify the INSERT ran in its own transaction
+            assert mock_conn.execute.call_count == 2
+            assert mock_conn.execute.call_args_list[0][0][0] == "BEGIN IMMEDIATE"
             call_args = mock_conn.execute.call_args
             assert "INSERT INTO turn_metadata" in str(call_args[0][0])
             # Verify parameters
@@ -376,11 +470,35 @@ class TestSQLiteRunAdapterWriteTurnMetadata:
             # Parse JSON and compare dict to avoid key ordering issues
             assert json.loads(params[2]) == {"like": 5, "comment": 2, "follow": 1}
             assert params[3] == "2024_01_01-12:00:00"
-            # Verify commit was called
             mock_conn.commit.assert_called_once()
+            mock_conn.rollback.assert_not_called()
+
+    def test_joins_open_transaction_without_committing(
+        self, adapter, default_test_data, mock_db_connection
+    ):
+        """Test that write_turn_metadata leaves the commit to an enclosing transaction."""
+        # Arrange
+        turn_metadata = TurnMetadata(
+            run_id=default_test_data["run_id"],
+            turn_number=default_test_data["turn_number"],
+            total_actions={TurnAction.LIKE: 5},
+            created_at="2024_01_01-12:00:00",
+        )
+
+        with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
+            mock_conn.in_transaction = True
+            mock_cursor.rowcount = 1
+
+            # Act
+            adapter.write_turn_metadata(turn_metadata)
+
+            # Assert
+            mock_conn.execute.assert_called_once()
+            mock_conn.commit.assert_not_called()
+            mock_conn.__exit__.assert_not_called()
 
     def test_raises_duplicate_turn_metadata_error_when_already_exists(
-        self, adapter, default_test_data
+        self, adapter, default_test_data, mock_db_connection
     ):
         """Test that write_turn_metadata raises DuplicateTurnMetadataError when metadata already exists."""
         # Arrange
@@ -396,24 +514,21 @@ class TestSQLiteRunAdapterWriteTurnMetadata:
             created_at="2024_01_01-12:00:00",
         )
 
-        # Mock read_turn_metadata to return existing metadata (duplicate)
-        existing_metadata = TurnMetadata(
-            run_id=run_id,
-            turn_number=turn_number,
-            total_actions={TurnAction.LIKE: 3},
-            created_at="2024_01_01-11:00:00",
-        )
-        adapter.read_turn_metadata = Mock(return_value=existing_metadata)
+        with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
+            mock_conn.in_transaction = False
+            # ON CONFLICT DO NOTHING affects no rows when the primary key exists
+            mock_cursor.rowcount = 0
 
-        # Act & Assert
-        with pytest.raises(
-            DuplicateTurnMetadataError,
-            match=f"Turn metadata already exists for run '{run_id}', turn {turn_number}",
-        ):
-            adapter.write_turn_metadata(turn_metadata)
+            # Act & Assert
+            with pytest.raises(
+                DuplicateTurnMetadataError,
+                match=f"Turn metadata already exists for run '{run_id}', turn {turn_number}",
+            ):
+                adapter.write_turn_metadata(turn_metadata)
 
-        # Verify read_turn_metadata was called
-        adapter.read_turn_metadata.assert_called_once_with(run_id, turn_number)
+            # Verify the transaction was rolled back, not committed
+            mock_conn.rollback.assert_called_once()
+            mock_conn.commit.assert_not_called()
 
     def test_raises_operational_error_on_database_error(
         self, adapter, default_test_data, mock_db_connection
@@ -430,9 +545,6 @@ class TestSQLiteRunAdapterWriteTurnMetadata:
             created_at="2024_01_01-12:00:00",
         )
 
-        # Mock read_turn_metadata to return None (no duplicate)
-        adapter.read_turn_metadata = Mock(return_value=None)
-
         db_error = sqlite3.OperationalError("Database locked")
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
             mock_conn.execute.side_effect = db_error
@@ -460,9 +572,6 @@ class TestSQLiteRunAdapterWriteTurnMetadata:
             created_at="2024_01_01-12:00:00",
         )
 
-        # Mock read_turn_metadata to return None (no duplicate)
-        adapter.read_turn_metadata = Mock(return_value=None)
-
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
             # Act
             adapter.write_turn_metadata(turn_metadata)
@@ -490,9 +599,6 @@ class TestSQLiteRunAdapterWriteTurnMetadata:
             created_at="2024_02_02-15:30:45",
         )
 
-        # Mock read_turn_metadata to return None (no duplicate)
-        adapter.read_turn_metadata = Mock(return_value=None)
-
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
             # Act
             adapter.write_turn_metadata(turn_metadata)
@@ -503,6 +609,7 @@ class TestSQLiteRunAdapterWriteTurnMetadata:
             # Verify SQL statement
             sql = str(call_args[0][0])
             assert "INSERT INTO turn_metadata" in sql
+            assert "ON CONFLICT (run_id, turn_number) DO NOTHING" in sql
             assert "run_id" in sql
             assert "turn_number" in sql
             assert "total_actions" in sql
@@ -513,80 +620,59 @@ class TestSQLiteRunAdapterWriteTurnMetadata:
             assert params == (
                 run_id,
                 turn_number,
-                json.dumps({"like": 7}),
+                '{"like":7}',
                 "2024_02_02-15:30:45",
             )
 
-    def test_converts_integrity_error_to_duplicate_turn_metadata_error(
+    def test_propagates_integrity_error_for_non_key_constraints(
         self, adapter, default_test_data, mock_db_connection
     ):
-        """Test that write_turn_metadata converts IntegrityError to DuplicateTurnMetadataError.
+        """Test that write_turn_metadata does not report a CHECK violation as a duplicate.
 
-        This handles race conditions and edge cases where the pre-check passes
-        but the INSERT fails due to a PRIMARY KEY constraint violation.
+        Only the primary key conflict is absorbed by ON CONFLICT DO NOTHING.
         """
         # Arrange
-        from db.exceptions import DuplicateTurnMetadataError
-
-        run_id = default_test_data["run_id"]
-        turn_number = default_test_data["turn_number"]
-
         turn_metadata = TurnMetadata(
-            run_id=run_id,
-            turn_number=turn_number,
+            run_id=default_test_data["run_id"],
+            turn_number=default_test_data["turn_number"],
             total_actions={TurnAction.LIKE: 5},
             created_at="2024_01_01-12:00:00",
         )
 
-        # Mock read_turn_metadata to return None (pre-check passes)
-        adapter.read_turn_metadata = Mock(return_value=None)
-
-        # Simulate PRIMARY KEY constraint violation (duplicate insert)
         integrity_error = sqlite3.IntegrityError(
-            "UNIQUE constraint failed: turn_metadata.run_id, turn_metadata.turn_number"
+            "CHECK constraint failed: turn_number >= 0"
         )
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
             mock_conn.execute.side_effect = integrity_error
 
             # Act & Assert
-            with pytest.raises(
-                DuplicateTurnMetadataError,
-                match=f"Turn metadata already exists for run '{run_id}', turn {turn_number}",
-            ):
+            with pytest.raises(sqlite3.IntegrityError, match="CHECK constraint"):
                 adapter.write_turn_metadata(turn_metadata)
 
-            # Verify read_turn_metadata was called (pre-check)
-            adapter.read_turn_metadata.assert_called_once_with(run_id, turn_number)
             # Verify INSERT was attempted
             mock_conn.execute.assert_called_once()
-            # Verify commit was NOT called (INSERT failed)
-            mock_conn.commit.assert_not_called()
 
     def test_does_not_commit_on_integrity_error(
         self, adapter, default_test_data, mock_db_connection
     ):
-        """Test that commit is not called when IntegrityError is raised."""
+        """Test that a failed INSERT is rolled back rather than committed."""
         # Arrange
-        from db.exceptions import DuplicateTurnMetadataError
-
-        run_id = default_test_data["run_id"]
-        turn_number = default_test_data["turn_number"]
-
         turn_metadata = TurnMetadata(
-            run_id=run_id,
-            turn_number=turn_number,
+            run_id=default_test_data["run_id"],
+            turn_number=default_test_data["turn_number"],
             total_actions={TurnAction.LIKE: 5},
             created_at="2024_01_01-12:00:00",
         )
 
-        adapter.read_turn_metadata = Mock(return_value=None)
-        integrity_error = sqlite3.IntegrityError("UNIQUE constraint failed")
+        integrity_error = sqlite3.IntegrityError("NOT NULL constraint failed")
         with mock_db_connection() as (mock_get_conn, mock_conn, mock_cursor):
-            mock_conn.execute.side_effect = integrity_error
+            mock_conn.in_transaction = False
+            mock_conn.execute.side_effect = [None, integrity_error]
 
             # Act & Assert
-            with pytest.raises(DuplicateTurnMetadataError):
+            with pytest.raises(sqlite3.IntegrityError):
                 adapter.write_turn_metadata(turn_metadata)
 
-            # Verify commit was never called
+            # Verify the transaction was rolled back and never committed
+            mock_conn.rollback.assert_called_once()
             mock_conn.commit.assert_not_called()
@@ -469,3 +469,36 @@ class TestSQLiteFeedPostRepositoryIntegration:
             "at://did:plc:test1/app.bsky.feed.post/test1",
             "at://did:plc:test2/app.bsky.feed.post/test2",
         }
+
+    def test_list_feed_posts_page_walks_all_posts_in_uri_order(self, temp_db):
+        """Test that consecutive pages cover every post exactly once, ordered by URI."""
+        repo = create_sqlite_feed_post_repository()
+        posts = [
+            BlueskyFeedPost(
+                id=f"at://did:plc:page{i}/app.bsky.feed.post/p{i}",
+                uri=f"at://did:plc:page{i}/app.bsky.feed.post/p{i}",
+                author_display_name=f"User {i}",
+                author_handle=f"page{i}.bsky.social",
+                text=f"Post {i}",
+                bookmark_count=0,
+                like_count=i,
+                quote_count=0,
+                reply_count=0,
+                repost_count=0,
+                created_at="2024-01-01T00:00:00Z",
+            )
+            for i in range(5)
+        ]
+        repo.create_or_update_feed_posts(list(reversed(posts)))
+
+        pages = [repo.list_feed_posts_page(limit=2, offset=o) for o in (0, 2, 4, 6)]
+
+        assert [len(page) for page in pages] == [2, 2, 1, 0]
+        assert [p.uri for page in pages for p in page] == sorted(p.uri for p in posts)
+
+    def test_list_feed_posts_page_rejects_negative_limit(self, temp_db):
+        """Test that a negative limit raises ValueError."""
+        repo = create_sqlite_feed_post_repository()
+
+        with pytest.raises(ValueError, match="limit cannot be negative"):
+            repo.list_feed_posts_page(limit=-1)
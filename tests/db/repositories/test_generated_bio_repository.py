@@ -192,6 +192,48 @@ class TestSQLiteGeneratedBioRepositoryCreateOrUpdateGeneratedBio:
         assert exc_info.value is original_error
 
 
+class TestSQLiteGeneratedBioRepositoryCreateOrUpdateGeneratedBios:
+    """Tests for SQLiteGeneratedBioRepository.create_or_update_generated_bios method (batch operation)."""
+
+    def test_creates_multiple_bios_with_single_adapter_call(self):
+        """Test that create_or_update_generated_bios writes all bios in one adapter call."""
+        # Arrange
+        mock_adapter = Mock(spec=GeneratedBioDatabaseAdapter)
+        repo = SQLiteGeneratedBioRepository(mock_adapter)
+        bios = [
+            GeneratedBio(
+                handle=f"user{i}.bsky.social",
+                generated_bio=f"Bio {i}",
+                metadata=GenerationMetadata(
+                    model_used=None,
+                    generation_metadata=None,
+                    created_at="2024-01-01T00:00:00Z",
+                ),
+            )
+            for i in range(1, 4)
+        ]
+
+        # Act
+        result = repo.create_or_update_generated_bios(bios)
+
+        # Assert
+        assert result == bios
+        mock_adapter.write_generated_bios.assert_called_once_with(bios)
+        mock_adapter.write_generated_bio.assert_not_called()
+
+    def test_raises_value_error_when_bios_is_none(self):
+        """Test that create_or_update_generated_bios raises ValueError when bios is None."""
+        # Arrange
+        mock_adapter = Mock(spec=GeneratedBioDatabaseAdapter)
+        repo = SQLiteGeneratedBioRepository(mock_adapter)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="bios cannot be None"):
+            repo.create_or_update_generated_bios(None)  # type: ignore
+
+        mock_adapter.write_generated_bios.assert_not_called()
+
+
 class TestSQLiteGeneratedBioRepositoryGetGeneratedBio:
     """Tests for SQLiteGeneratedBioRepository.get_generated_bio method."""
 
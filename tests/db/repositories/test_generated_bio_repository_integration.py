@@ -181,7 +181,7 @@ class TestSQLiteGeneratedBioRepositoryIntegration:
         assert retrieved_bio is not None
         assert retrieved_bio.handle == "update.bsky.social"
         assert retrieved_bio.generated_bio == "Updated bio text with more information"
-        # Note: created_at will be the updated timestamp since we use INSERT OR REPLACE
+        # Note: created_at will be the updated timestamp since the write upserts on handle
 
     def test_get_generated_bio_returns_none_for_nonexistent_handle(self, temp_db):
         """Test that get_generated_bio returns None for a non-existent handle."""
@@ -284,3 +284,29 @@ class TestSQLiteGeneratedBioRepositoryIntegration:
 
         assert retrieved is not None
         assert retrieved.generated_bio == bio_text
+
+    def test_create_or_update_generated_bios_batch_persists_to_database(self, temp_db):
+        """Test that create_or_update_generated_bios persists every bio in the batch."""
+        repo = create_sqlite_generated_bio_repository()
+        created_at = get_current_timestamp()
+        bios = [
+            GeneratedBio(
+                handle=f"user{i}.bsky.social",
+                generated_bio=f"Bio {i}",
+                metadata=GenerationMetadata(
+                    model_used=None,
+                    generation_metadata=None,
+                    created_at=created_at,
+                ),
+            )
+            for i in range(5)
+        ]
+
+        result = repo.create_or_update_generated_bios(bios)
+
+        assert result == bios
+        stored = {bio.handle: bio for bio in repo.list_all_generated_bios()}
+        assert len(stored) == 5
+        for bio in bios:
+            assert stored[bio.handle].generated_bio == bio.generated_bio
+            assert stored[bio.handle].metadata.created_at == created_at
@@ -334,3 +334,68 @@ class TestSQLiteGeneratedFeedRepositoryIntegration:
         feeds = repo.read_feeds_for_turn("run_999", 99)
         assert feeds == []
         assert isinstance(feeds, list)
+
+    def test_write_generated_feeds_persists_batch(self, temp_db):
+        """Test that feeds written as one batch on the adapter are readable."""
+        from db.adapters.sqlite.generated_feed_adapter import (
+            SQLiteGeneratedFeedAdapter,
+        )
+
+        adapter = SQLiteGeneratedFeedAdapter()
+        feeds = [
+            GeneratedFeed(
+                feed_id=f"feed_agent{i}",
+                run_id="run_123",
+                turn_number=0,
+                agent_handle=f"agent{i}.bsky.social",
+                post_uris=[f"at://did:plc:test{i}/app.bsky.feed.post/post{i}"],
+                created_at="2024-01-01T00:00:00Z",
+            )
+            for i in range(3)
+        ]
+
+        adapter.write_generated_feeds(feeds)
+
+        result = adapter.read_feeds_for_turn("run_123", 0)
+        assert sorted(f.feed_id for f in result) == [f.feed_id for f in feeds]
+        assert {f.agent_handle: f.post_uris for f in result} == {
+            f.agent_handle: f.post_uris for f in feeds
+        }
+
+    def test_get_post_uris_for_run_dedupes_across_turns(self, temp_db):
+        """Test that post URIs are collected across turns for one agent and run, deduplicated."""
+        repo = create_sqlite_generated_feed_repository()
+        uris = [f"at://did:plc:test{i}/app.bsky.feed.post/post{i}" for i in range(4)]
+        feeds = [
+            GeneratedFeed(
+                feed_id="feed_turn0",
+                run_id="run_123",
+                turn_number=0,
+                agent_handle="test.bsky.social",
+                post_uris=[uris[0], uris[1]],
+                created_at="2024-01-01T00:00:00Z",
+            ),
+            GeneratedFeed(
+                feed_id="feed_turn1",
+                run_id="run_123",
+                turn_number=1,
+                agent_handle="test.bsky.social",
+                post_uris=[uris[1], uris[2]],
+                created_at="2024-01-01T00:00:00Z",
+            ),
+            GeneratedFeed(
+                feed_id="feed_other_run",
+                run_id="run_456",
+                turn_number=0,
+                agent_handle="test.bsky.social",
+                post_uris=[uris[3]],
+                created_at="2024-01-01T00:00:00Z",
+            ),
+        ]
+        for feed in feeds:
+            repo.create_or_update_generated_feed(feed)
+
+        result = repo.get_post_uris_for_run("test.bsky.social", "run_123")
+
+        assert result == {uris[0], uris[1], uris[2]}
+        assert repo.get_post_uris_for_run("test.bsky.social", "run_999") == set()
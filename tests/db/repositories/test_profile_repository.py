@@ -191,6 +191,48 @@ class TestSQLiteProfileRepositoryCreateOrUpdateProfile:
         assert "Invalid data" in str(exc_info.value)
 
 
+class TestSQLiteProfileRepositoryCreateOrUpdateProfiles:
+    """Tests for SQLiteProfileRepository.create_or_update_profiles method (batch operation)."""
+
+    def test_creates_multiple_profiles_with_single_adapter_call(self):
+        """Test that create_or_update_profiles writes all profiles in one adapter call."""
+        # Arrange
+        mock_adapter = Mock(spec=ProfileDatabaseAdapter)
+        repo = SQLiteProfileRepository(mock_adapter)
+        profiles = [
+            BlueskyProfile(
+                handle=f"user{i}.bsky.social",
+                did=f"did:plc:user{i}",
+                display_name=f"User {i}",
+                bio=f"Bio {i}",
+                followers_count=i * 10,
+                follows_count=i,
+                posts_count=i * 2,
+            )
+            for i in range(1, 4)
+        ]
+
+        # Act
+        result = repo.create_or_update_profiles(profiles)
+
+        # Assert
+        assert result == profiles
+        mock_adapter.write_profiles.assert_called_once_with(profiles)
+        mock_adapter.write_profile.assert_not_called()
+
+    def test_raises_value_error_when_profiles_is_none(self):
+        """Test that create_or_update_profiles raises ValueError when profiles is None."""
+        # Arrange
+        mock_adapter = Mock(spec=ProfileDatabaseAdapter)
+        repo = SQLiteProfileRepository(mock_adapter)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="profiles cannot be None"):
+            repo.create_or_update_profiles(None)  # type: ignore
+
+        mock_adapter.write_profiles.assert_not_called()
+
+
 class TestSQLiteProfileRepositoryGetProfile:
     """Tests for SQLiteProfileRepository.get_profile method."""
 
@@ -312,6 +354,63 @@ class TestSQLiteProfileRepositoryGetProfile:
         mock_adapter.read_profile.assert_not_called()
 
 
+class TestSQLiteProfileRepositoryGetProfilesByHandles:
+    """Tests for SQLiteProfileRepository.get_profiles_by_handles method."""
+
+    def test_delegates_to_adapter_in_one_call(self):
+        """Test that get_profiles_by_handles reads all handles with one adapter call."""
+        # Arrange
+        mock_adapter = Mock(spec=ProfileDatabaseAdapter)
+        repo = SQLiteProfileRepository(mock_adapter)
+        handles = ["a.bsky.social", "b.bsky.social"]
+        expected = [
+            BlueskyProfile(
+                handle="a.bsky.social",
+                did="did:plc:a",
+                display_name="A",
+                bio="Bio A",
+                followers_count=1,
+                follows_count=1,
+                posts_count=1,
+            )
+        ]
+        mock_adapter.read_profiles_by_handles.return_value = expected
+
+        # Act
+        result = repo.get_profiles_by_handles(handles)
+
+        # Assert
+        assert result == expected
+        mock_adapter.read_profiles_by_handles.assert_called_once_with(handles)
+        mock_adapter.read_profile.assert_not_called()
+
+    def test_returns_empty_list_without_adapter_call_for_no_handles(self):
+        """Test that an empty handle collection short-circuits without querying."""
+        # Arrange
+        mock_adapter = Mock(spec=ProfileDatabaseAdapter)
+        repo = SQLiteProfileRepository(mock_adapter)
+
+        # Act
+        result = repo.get_profiles_by_handles([])
+
+        # Assert
+        assert result == []
+        mock_adapter.read_profiles_by_handles.assert_not_called()
+
+    @pytest.mark.parametrize("bad_handle", ["", "   "])
+    def test_raises_value_error_when_any_handle_is_empty(self, bad_handle):
+        """Test that get_profiles_by_handles rejects empty or whitespace handles."""
+        # Arrange
+        mock_adapter = Mock(spec=ProfileDatabaseAdapter)
+        repo = SQLiteProfileRepository(mock_adapter)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="handle cannot be empty"):
+            repo.get_profiles_by_handles(["ok.bsky.social", bad_handle])
+
+        mock_adapter.read_profiles_by_handles.assert_not_called()
+
+
 class TestSQLiteProfileRepositoryListProfiles:
     """Tests for SQLiteProfileRepository.list_profiles method."""
 
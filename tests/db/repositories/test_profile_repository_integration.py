@@ -286,3 +286,78 @@ class TestSQLiteProfileRepositoryIntegration:
         assert retrieved is not None
         assert retrieved.handle == "user-name.bsky.social"
         assert retrieved.bio == "Bio with special chars: !@#$%"
+
+    def test_create_or_update_profiles_writes_batch(self, temp_db):
+        """Test that create_or_update_profiles persists every profile in the batch."""
+        repo = create_sqlite_profile_repository()
+        profiles = [
+            BlueskyProfile(
+                handle=f"batch{i}.bsky.social",
+                did=f"did:plc:batch{i}",
+                display_name=f"Batch {i}",
+                bio=f"Bio {i}",
+                followers_count=i,
+                follows_count=i,
+                posts_count=i,
+            )
+            for i in range(3)
+        ]
+
+        repo.create_or_update_profiles(profiles)
+
+        retrieved = {p.handle: p for p in repo.list_profiles()}
+        assert retrieved == {p.handle: p for p in profiles}
+
+    def test_get_profiles_by_handles_returns_found_profiles_in_input_order(
+        self, temp_db
+    ):
+        """Test that get_profiles_by_handles returns existing profiles in the requested order."""
+        repo = create_sqlite_profile_repository()
+        profiles = [
+            BlueskyProfile(
+                handle=f"lookup{i}.bsky.social",
+                did=f"did:plc:lookup{i}",
+                display_name=f"Lookup {i}",
+                bio=f"Bio {i}",
+                followers_count=i,
+                follows_count=i,
+                posts_count=i,
+            )
+            for i in range(3)
+        ]
+        repo.create_or_update_profiles(profiles)
+
+        result = repo.get_profiles_by_handles(
+            [
+                "lookup2.bsky.social",
+                "missing.bsky.social",
+                "lookup0.bsky.social",
+                "lookup2.bsky.social",
+            ]
+        )
+
+        assert result == [profiles[2], profiles[0]]
+
+    def test_get_profiles_by_handles_splits_large_lookups(self, temp_db, monkeypatch):
+        """Test that lookups larger than the IN-list limit are split across queries."""
+        import db.db
+
+        monkeypatch.setattr(db.db, "_MAX_IN_PARAMS", 2)
+        repo = create_sqlite_profile_repository()
+        profiles = [
+            BlueskyProfile(
+                handle=f"chunk{i}.bsky.social",
+                did=f"did:plc:chunk{i}",
+                display_name=f"Chunk {i}",
+                bio=f"Bio {i}",
+                followers_count=i,
+                follows_count=i,
+                posts_count=i,
+            )
+            for i in range(5)
+        ]
+        repo.create_or_update_profiles(profiles)
+
+        result = repo.get_profiles_by_handles(p.handle for p in profiles)
+
+        assert result == profiles
@@ -1280,6 +1280,46 @@ class TestSQLiteRunRepositoryGetTurnMetadata:
         assert result.total_actions[TurnAction.FOLLOW] == 0
 
 
+class TestSQLiteRunRepositoryListTurnMetadata:
+    """Tests for SQLiteRunRepository.list_turn_metadata method."""
+
+    def test_returns_turn_metadata_from_adapter(self):
+        """Test that list_turn_metadata returns the adapter's list in a single call."""
+        # Arrange
+        mock_adapter = Mock(spec=RunDatabaseAdapter)
+        mock_get_timestamp = Mock(return_value="2024_01_01-12:00:00")
+        repo = SQLiteRunRepository(mock_adapter, mock_get_timestamp)
+        run_id = "run_123"
+        expected = [
+            make_turn_metadata(run_id=run_id, turn_number=0),
+            make_turn_metadata(run_id=run_id, turn_number=1),
+        ]
+        mock_adapter.read_turn_metadata_for_run.return_value = expected
+
+        # Act
+        result = repo.list_turn_metadata(run_id)
+
+        # Assert
+        assert result == expected
+        mock_adapter.read_turn_metadata_for_run.assert_called_once_with(run_id)
+        mock_adapter.read_turn_metadata.assert_not_called()
+
+    @pytest.mark.parametrize("run_id", ["", "   "])
+    def test_raises_valueerror_for_empty_run_id(self, run_id):
+        """Test that list_turn_metadata raises ValueError for empty or whitespace run_id."""
+        # Arrange
+        mock_adapter = Mock(spec=RunDatabaseAdapter)
+        mock_get_timestamp = Mock(return_value="2024_01_01-12:00:00")
+        repo = SQLiteRunRepository(mock_adapter, mock_get_timestamp)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="run_id cannot be empty"):
+            repo.list_turn_metadata(run_id)
+
+        # Verify adapter was not called
+        mock_adapter.read_turn_metadata_for_run.assert_not_called()
+
+
 class TestSQLiteRunRepositoryWriteTurnMetadata:
     """Tests for SQLiteRunRepository.write_turn_metadata method."""
 
@@ -0,0 +1,834 @@
+"""Tests for db.db connection management."""
+
+import os
+import sqlite3
+import tempfile
+import threading
+from unittest.mock import patch
+
+import pytest
+
+import db.db
+from db.db import (
+    close_connection,
+    get_connection,
+    initialize_database,
+    iter_all_feed_posts,
+    iter_all_generated_feeds,
+    read_feed_post,
+    read_feed_posts_by_author,
+    read_profile,
+    transaction,
+    write_feed_post,
+    write_feed_posts,
+    write_generated_bios,
+    write_generated_feeds,
+    write_profile,
+    write_profiles,
+)
+from simulation.core.models.feeds import GeneratedFeed
+from simulation.core.models.posts import BlueskyFeedPost
+from simulation.core.models.profiles import BlueskyProfile
+
+
+@pytest.fixture
+def temp_db_path():
+    """Point db.db.DB_PATH at a temporary database file for the test."""
+    original_path = db.db.DB_PATH
+
+    fd, temp_path = tempfile.mkstemp(suffix=".sqlite")
+    os.close(fd)
+    db.db.DB_PATH = temp_path
+
+    yield temp_path
+
+    close_connection()
+    db.db.DB_PATH = original_path
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+
+
+class TestGetConnection:
+    """Tests for get_connection function."""
+
+    def test_returns_same_connection_within_thread(self, temp_db_path):
+        """Test that repeated calls on one thread reuse the cached connection."""
+        # Act
+        first = get_connection()
+        second = get_connection()
+
+        # Assert
+        assert first is second
+
+    def test_returns_tuple_rows_and_applies_session_pragmas(self, temp_db_path):
+        """Test that the connection returns plain tuples and has pragmas applied."""
+        # Act
+        conn = get_connection()
+
+        # Assert
+        assert conn.row_factory is None
+        assert type(conn.execute("SELECT 1").fetchone()) is tuple
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+    def test_opens_connection_with_statement_cache_size(self, temp_db_path):
+        """Test that connections are opened with the enlarged statement cache."""
+        # Arrange
+        from db.db import _BUSY_TIMEOUT_SECONDS, _STATEMENT_CACHE_SIZE
+
+        with patch("db.db.sqlite3.connect", wraps=sqlite3.connect) as mock_connect:
+            # Act
+            get_connection()
+
+            # Assert
+            mock_connect.assert_called_once_with(
+                temp_db_path,
+                timeout=_BUSY_TIMEOUT_SECONDS,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+                uri=False,
+            )
+
+    def test_file_uri_supports_concurrent_writers(self, temp_db_path):
+        """Test that threads writing through a file URI all succeed concurrently."""
+        # Arrange
+        db.db.DB_PATH = f"file:{temp_db_path}"
+        initialize_database()
+        num_threads = 4
+        start = threading.Barrier(num_threads)
+        errors = []
+
+        def write_and_read(i):
+            try:
+                start.wait()
+                for j in range(20):
+                    handle = f"user{i}-{j}.bsky.social"
+                    write_profile(make_profile(handle))
+                    assert read_profile(handle) == make_profile(handle)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                close_connection()
+
+        # Act
+        threads = [
+            threading.Thread(target=write_and_read, args=(i,))
+            for i in range(num_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert errors == []
+        count = get_connection().execute("SELECT COUNT(*) FROM bluesky_profiles")
+        assert count.fetchone()[0] == num_threads * 20
+
+    def test_sets_busy_timeout(self, temp_db_path):
+        """Test that the connection waits on a locked database instead of failing immediately."""
+        # Act
+        conn = get_connection()
+
+        # Assert
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_reopens_when_db_path_changes(self, temp_db_path):
+        """Test that a new connection is opened after DB_PATH is changed."""
+        # Arrange
+        first = get_connection()
+        fd, other_path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(fd)
+
+        try:
+            db.db.DB_PATH = other_path
+
+            # Act
+            second = get_connection()
+
+            # Assert
+            assert second is not first
+            # The previous connection was closed when it was replaced
+            with pytest.raises(sqlite3.ProgrammingError):
+                first.execute("SELECT 1")
+        finally:
+            close_connection()
+            db.db.DB_PATH = temp_db_path
+            os.unlink(other_path)
+
+    def test_returns_distinct_connection_per_thread(self, temp_db_path):
+        """Test that each thread gets its own connection."""
+        # Arrange
+        main_conn = get_connection()
+        thread_conns = []
+
+        def worker():
+            thread_conns.append(get_connection())
+
+        # Act
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        # Assert
+        assert len(thread_conns) == 1
+        assert thread_conns[0] is not main_conn
+
+    def test_transaction_block_does_not_close_connection(self, temp_db_path):
+        """Test that a `transaction()` block leaves the cached connection open."""
+        # Act
+        with transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        # Assert
+        assert get_connection() is conn
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+class TestLookupCursor:
+    """Tests for _lookup_cursor function."""
+
+    def test_reuses_cursor_on_same_connection(self, temp_db_path):
+        """Test that repeated lookups on one thread share a cursor on the cached connection."""
+        # Arrange
+        from db.db import _lookup_cursor
+
+        # Act
+        first = _lookup_cursor()
+        second = _lookup_cursor()
+
+        # Assert
+        assert first is second
+        assert first.connection is get_connection()
+
+    def test_replaces_cursor_after_connection_closed(self, temp_db_path):
+        """Test that a new cursor is created once the cached connection is replaced."""
+        # Arrange
+        from db.db import _lookup_cursor
+
+        first = _lookup_cursor()
+        close_connection()
+
+        # Act
+        second = _lookup_cursor()
+
+        # Assert
+        assert second is not first
+        assert second.connection is get_connection()
+        assert second.execute("SELECT 1").fetchone()[0] == 1
+
+    def test_returns_plain_tuple_rows(self, temp_db_path):
+        """Test that the lookup cursor yields plain tuples."""
+        # Arrange
+        from db.db import _lookup_cursor
+
+        # Act
+        row = _lookup_cursor().execute("SELECT 1, 2").fetchone()
+
+        # Assert
+        assert type(row) is tuple
+
+
+class TestCloseConnection:
+    """Tests for close_connection function."""
+
+    def test_closes_cached_connection(self, temp_db_path):
+        """Test that close_connection closes the connection and a new one is opened next."""
+        # Arrange
+        conn = get_connection()
+
+        # Act
+        close_connection()
+
+        # Assert
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert get_connection() is not conn
+
+    def test_is_noop_without_connection(self, temp_db_path):
+        """Test that close_connection does nothing when no connection is cached."""
+        # Arrange
+        close_connection()
+
+        # Act & Assert (no exception)
+        close_connection()
+
+
+class TestTransaction:
+    """Tests for transaction context manager."""
+
+    def test_commits_enclosed_statements_once(self, temp_db_path):
+        """Test that statements in the block are committed together on exit."""
+        # Arrange
+        with transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        # Act
+        with transaction() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            conn.execute("INSERT INTO t VALUES (2)")
+            assert conn.in_transaction
+
+        # Assert
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2
+
+    def test_rolls_back_on_exception(self, temp_db_path):
+        """Test that an exception in the block rolls back every statement."""
+        # Arrange
+        with transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with transaction() as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                raise RuntimeError("boom")
+
+        # Assert
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_nested_block_joins_outer_transaction(self, temp_db_path):
+        """Test that a nested transaction does not commit the outer one early."""
+        # Arrange
+        with transaction() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with transaction() as outer:
+                with transaction() as inner:
+                    inner.execute("INSERT INTO t VALUES (1)")
+                # Still inside the outer transaction after the inner block
+                assert outer.in_transaction
+                raise RuntimeError("boom")
+
+        # Assert: the outer rollback also discarded the inner insert
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_read_inside_block_does_not_commit_it(self, temp_db_path):
+        """Test that a reader called mid-transaction leaves the rollback intact."""
+        # Arrange
+        initialize_database()
+        profile = make_profile("user.bsky.social")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with transaction():
+                write_profile(profile)
+                read_feed_posts_by_author(profile.handle)
+                raise RuntimeError("boom")
+
+        # Assert
+        assert read_profile(profile.handle) is None
+
+
+class TestInitializeDatabase:
+    """Tests for initialize_database function."""
+
+    @pytest.mark.parametrize(
+        "sql, params, index_name",
+        [
+            (
+                "SELECT feed_id FROM generated_feeds WHERE run_id = ? AND turn_number = ?",
+                ("run_1", 0),
+                "idx_generated_feeds_run_id_turn_number",
+            ),
+            (
+                "SELECT post_uris FROM generated_feeds WHERE agent_handle = ? AND run_id = ?",
+                ("user.bsky.social", "run_1"),
+                "sqlite_autoindex_generated_feeds_1",
+            ),
+            (
+                "SELECT uri FROM bluesky_feed_posts WHERE author_handle = ?",
+                ("user.bsky.social",),
+                "idx_bluesky_feed_posts_author_handle",
+            ),
+        ],
+    )
+    def test_hot_lookups_use_an_index(self, temp_db_path, sql, params, index_name):
+        """Test that the filtered read queries are planned as index searches."""
+        # Arrange
+        initialize_database()
+
+        # Act
+        plan = " ".join(
+            row[3]
+            for row in get_connection().execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        )
+
+        # Assert
+        assert f"USING INDEX {index_name}" in plan
+
+    @pytest.mark.skipif(
+        sqlite3.sqlite_version_info < (3, 37, 0),
+        reason="STRICT tables need SQLite 3.37+",
+    )
+    def test_tables_reject_mistyped_values(self, temp_db_path):
+        """Test that tables are STRICT, so a non-integer count is rejected."""
+        # Arrange
+        initialize_database()
+
+        # Act & Assert
+        with pytest.raises(sqlite3.IntegrityError):
+            with transaction() as conn:
+                conn.execute(
+                    "INSERT INTO bluesky_profiles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ("h.bsky.social", "did:plc:h", "H", "Bio", "many", 1, 1),
+                )
+
+    def test_stamps_schema_version(self, temp_db_path):
+        """Test that the applied schema version is recorded in the database."""
+        # Act
+        initialize_database()
+
+        # Assert
+        version = get_connection().execute("PRAGMA user_version").fetchone()[0]
+        assert version == db.db._SCHEMA_VERSION
+
+    def test_skips_schema_when_version_is_current(self, temp_db_path):
+        """Test that a database already at the schema version is not re-initialized."""
+        # Arrange
+        initialize_database()
+
+        # Act
+        with patch.object(db.db, "_SCHEMA_SQL", "this is not sql"):
+            initialize_database()
+
+        # Assert
+        assert get_connection().execute("PRAGMA user_version").fetchone()[0] == (
+            db.db._SCHEMA_VERSION
+        )
+
+    def test_refuses_to_run_inside_a_transaction(self, temp_db_path):
+        """Test that an enclosing transaction's writes are not committed by the schema script."""
+        # Arrange
+        initialize_database()
+        get_connection().execute("PRAGMA user_version = 0")
+
+        # Act
+        with pytest.raises(RuntimeError, match="inside a transaction"):
+            with transaction():
+                write_profile(make_profile("pending.bsky.social"))
+                initialize_database()
+
+        # Assert: the rollback still discarded the pending write
+        assert read_profile("pending.bsky.social") is None
+
+    def test_applies_schema_when_version_is_outdated(self, temp_db_path):
+        """Test that a database at an older schema version gets the schema applied."""
+        # Arrange
+        get_connection().execute("PRAGMA user_version = 0")
+
+        # Act
+        initialize_database()
+
+        # Assert
+        tables = {
+            row[0]
+            for row in get_connection().execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        assert "bluesky_profiles" in tables
+
+
+def make_post(i: int) -> BlueskyFeedPost:
+    """Build a feed post with a unique URI for index i."""
+    uri = f"at://did:plc:test{i}/app.bsky.feed.post/test{i}"
+    return BlueskyFeedPost(
+        id=uri,
+        uri=uri,
+        author_display_name=f"User {i}",
+        author_handle=f"user{i}.bsky.social",
+        text=f"Post {i}",
+        bookmark_count=0,
+        like_count=i,
+        quote_count=0,
+        reply_count=0,
+        repost_count=0,
+        created_at="2024-01-01T00:00:00Z",
+    )
+
+
+class TestIterAllFeedPosts:
+    """Tests for iter_all_feed_posts function."""
+
+    def test_yields_every_post_across_batches(self, temp_db_path):
+        """Test that all posts are yielded when they span several fetchmany batches."""
+        # Arrange
+        initialize_database()
+        posts = [make_post(i) for i in range(5)]
+        write_feed_posts(posts)
+
+        # Act
+        result = list(iter_all_feed_posts(batch_size=2))
+
+        # Assert
+        assert sorted(post.uri for post in result) == sorted(p.uri for p in posts)
+
+    def test_is_lazy_and_does_not_open_a_transaction(self, temp_db_path):
+        """Test that iteration is lazy and leaves no transaction open between items."""
+        # Arrange
+        initialize_database()
+        write_feed_posts([make_post(i) for i in range(3)])
+
+        # Act
+        iterator = iter_all_feed_posts(batch_size=1)
+        first = next(iterator)
+
+        # Assert
+        assert isinstance(first, BlueskyFeedPost)
+        assert not get_connection().in_transaction
+        assert len(list(iterator)) == 2
+
+    def test_yields_nothing_for_empty_table(self, temp_db_path):
+        """Test that an empty table yields no posts."""
+        # Arrange
+        initialize_database()
+
+        # Act & Assert
+        assert list(iter_all_feed_posts()) == []
+
+
+class TestIterAllGeneratedFeeds:
+    """Tests for iter_all_generated_feeds function."""
+
+    def test_yields_every_feed_across_batches(self, temp_db_path):
+        """Test that all feeds are yielded when they span several fetchmany batches."""
+        # Arrange
+        from db.db import write_generated_feeds
+
+        initialize_database()
+        feeds = [
+            GeneratedFeed(
+                feed_id=f"feed_{i}",
+                run_id="run_1",
+                turn_number=i,
+                agent_handle="agent.bsky.social",
+                post_uris=[f"at://did:plc:x/app.bsky.feed.post/{i}"],
+                created_at="2024-01-01T00:00:00Z",
+            )
+            for i in range(3)
+        ]
+        write_generated_feeds(feeds)
+
+        # Act
+        result = list(iter_all_generated_feeds(batch_size=2))
+
+        # Assert
+        assert sorted(result, key=lambda f: f.turn_number) == feeds
+
+
+class TestIterAllRuns:
+    """Tests for iter_all_runs function."""
+
+    def test_yields_every_run_newest_first_across_batches(self, temp_db_path):
+        """Test that all runs are yielded newest first when they span several batches."""
+        # Arrange
+        from db.db import iter_all_runs, write_run
+        from simulation.core.models.runs import Run, RunStatus
+
+        initialize_database()
+        runs = [
+            Run(
+                run_id=f"run_{i}",
+                created_at=f"2024_01_0{i + 1}-12:00:00",
+                total_turns=1,
+                total_agents=1,
+                started_at=f"2024_01_0{i + 1}-12:00:00",
+                status=RunStatus.RUNNING,
+            )
+            for i in range(3)
+        ]
+        for run in runs:
+            write_run(run)
+
+        # Act
+        result = list(iter_all_runs(batch_size=2))
+
+        # Assert
+        assert result == runs[::-1]
+
+
+def make_profile(handle: str, bio: str = "Bio") -> BlueskyProfile:
+    """Build a profile for the given handle."""
+    return BlueskyProfile(
+        handle=handle,
+        did=f"did:plc:{handle}",
+        display_name="User",
+        bio=bio,
+        followers_count=1,
+        follows_count=1,
+        posts_count=1,
+    )
+
+
+class TestReadCache:
+    """Tests for the read-through caches behind read_profile and read_feed_post."""
+
+    @pytest.fixture(autouse=True)
+    def empty_caches(self):
+        """Start and end each test with empty caches."""
+        db.db._PROFILE_CACHE.clear()
+        db.db._FEED_POST_CACHE.clear()
+        yield
+        db.db._PROFILE_CACHE.clear()
+        db.db._FEED_POST_CACHE.clear()
+
+    def test_repeat_read_profile_skips_database(self, temp_db_path):
+        """Test that a second read_profile for the same handle does not query SQLite."""
+        # Arrange
+        initialize_database()
+        write_profile(make_profile("cached.bsky.social"))
+        first = read_profile("cached.bsky.social")
+        statements = []
+        get_connection().set_trace_callback(statements.append)
+
+        # Act
+        try:
+            second = read_profile("cached.bsky.social")
+        finally:
+            get_connection().set_trace_callback(None)
+
+        # Assert
+        assert not any("bluesky_profiles" in sql for sql in statements)
+        assert second == first
+
+    def test_write_profile_invalidates_cached_profile(self, temp_db_path):
+        """Test that writing a profile makes the next read return the new data."""
+        # Arrange
+        initialize_database()
+        write_profile(make_profile("cached.bsky.social", bio="Old"))
+        read_profile("cached.bsky.social")
+
+        # Act
+        write_profile(make_profile("cached.bsky.social", bio="New"))
+
+        # Assert
+        result = read_profile("cached.bsky.social")
+        assert result is not None
+        assert result.bio == "New"
+
+    def test_write_profiles_invalidates_cached_profiles(self, temp_db_path):
+        """Test that the batch writer also invalidates cached profiles."""
+        # Arrange
+        initialize_database()
+        write_profiles([make_profile("a.bsky.social", bio="Old")])
+        read_profile("a.bsky.social")
+
+        # Act
+        write_profiles([make_profile("a.bsky.social", bio="New")])
+
+        # Assert
+        result = read_profile("a.bsky.social")
+        assert result is not None
+        assert result.bio == "New"
+
+    def test_read_inside_transaction_is_not_cached(self, temp_db_path):
+        """Test that a row read inside a rolled-back transaction is not served later."""
+        # Arrange
+        initialize_database()
+
+        # Act
+        with pytest.raises(RuntimeError):
+            with transaction():
+                write_profile(make_profile("rolled.bsky.social"))
+                assert read_profile("rolled.bsky.social") is not None
+                raise RuntimeError("boom")
+
+        # Assert
+        assert read_profile("rolled.bsky.social") is None
+
+    def test_write_in_outer_transaction_invalidates_on_exit(self, temp_db_path):
+        """Test that a row re-cached before the outer commit is dropped afterwards."""
+        # Arrange
+        initialize_database()
+        old = make_profile("outer.bsky.social", bio="Old")
+        write_profile(old)
+
+        # Act
+        with transaction():
+            write_profile(make_profile("outer.bsky.social", bio="New"))
+            # Another thread reading the committed row meanwhile re-caches it
+            db.db._PROFILE_CACHE.put(
+                "outer.bsky.social", old, db.db._PROFILE_CACHE.generation()
+            )
+
+        # Assert
+        result = read_profile("outer.bsky.social")
+        assert result is not None
+        assert result.bio == "New"
+
+    def test_row_read_before_concurrent_write_is_not_cached(self, temp_db_path):
+        """Test that a reader racing a writer cannot cache the pre-write row."""
+        # Arrange
+        initialize_database()
+        write_profile(make_profile("race.bsky.social", bio="Old"))
+        written = threading.Event()
+        reader_done = threading.Event()
+        seen_by_writer = []
+
+        def writer():
+            # Record this connection's data_version first, as a warm thread would
+            read_profile("other.bsky.social")
+            write_profile(make_profile("race.bsky.social", bio="New"))
+            written.set()
+            reader_done.wait()
+            seen_by_writer.append(read_profile("race.bsky.social"))
+            close_connection()
+
+        writer_thread = threading.Thread(target=writer)
+        row_to_profile = db.db._row_to_profile
+
+        def row_to_profile_then_write(row):
+            # The reader already holds the old row when the writer commits
+            writer_thread.start()
+            written.wait()
+            return row_to_profile(row)
+
+        # Act
+        with patch.object(db.db, "_row_to_profile", row_to_profile_then_write):
+            read_profile("race.bsky.social")
+        reader_done.set()
+        writer_thread.join()
+
+        # Assert
+        assert seen_by_writer[0] is not None
+        assert seen_by_writer[0].bio == "New"
+
+    def test_change_from_another_connection_is_seen(self, temp_db_path):
+        """Test that a cached profile is dropped once another connection commits."""
+        # Arrange
+        initialize_database()
+        write_profile(make_profile("shared.bsky.social", bio="Old"))
+        read_profile("shared.bsky.social")
+
+        # Act: update through a separate connection, as another process would
+        other = sqlite3.connect(temp_db_path)
+        try:
+            other.execute(
+                "UPDATE bluesky_profiles SET bio = ? WHERE handle = ?",
+                ("New", "shared.bsky.social"),
+            )
+            other.commit()
+        finally:
+            other.close()
+
+        # Assert
+        result = read_profile("shared.bsky.social")
+        assert result is not None
+        assert result.bio == "New"
+
+    def test_missing_profile_is_not_cached(self, temp_db_path):
+        """Test that a miss is not remembered, so a later insert is visible."""
+        # Arrange
+        initialize_database()
+        assert read_profile("late.bsky.social") is None
+        with transaction() as conn:
+            conn.execute(
+                "INSERT INTO bluesky_profiles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ("late.bsky.social", "did:plc:late", "Late", "Bio", 1, 1, 1),
+            )
+
+        # Act
+        result = read_profile("late.bsky.social")
+
+        # Assert
+        assert result is not None
+        assert result.handle == "late.bsky.social"
+
+    def test_mutating_result_does_not_change_cache(self, temp_db_path):
+        """Test that callers get copies, so mutating a result leaves the cache intact."""
+        # Arrange
+        initialize_database()
+        write_feed_post(make_post(1))
+        uri = make_post(1).uri
+
+        # Act
+        read_feed_post(uri).text = "mutated"
+
+        # Assert
+        assert read_feed_post(uri).text == "Post 1"
+
+    def test_cache_is_scoped_to_db_path(self, temp_db_path):
+        """Test that a cached profile is not served after DB_PATH points elsewhere."""
+        # Arrange
+        initialize_database()
+        write_profile(make_profile("scoped.bsky.social"))
+        read_profile("scoped.bsky.social")
+        fd, other_path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(fd)
+
+        try:
+            db.db.DB_PATH = other_path
+            initialize_database()
+
+            # Act
+            result = read_profile("scoped.bsky.social")
+
+            # Assert
+            assert result is None
+        finally:
+            close_connection()
+            db.db.DB_PATH = temp_db_path
+            os.unlink(other_path)
+
+    def test_write_feed_posts_invalidates_cached_posts(self, temp_db_path):
+        """Test that the batch post writer invalidates cached posts."""
+        # Arrange
+        initialize_database()
+        write_feed_posts([make_post(2)])
+        uri = make_post(2).uri
+        read_feed_post(uri)
+        updated = make_post(2).model_copy(update={"like_count": 99})
+
+        # Act
+        write_feed_posts([updated])
+
+        # Assert
+        assert read_feed_post(uri).like_count == 99
+
+
+class TestWriteProfile:
+    """Tests for write_profile function."""
+
+    def test_overwrite_updates_existing_row_in_place(self, temp_db_path):
+        """Test that rewriting a profile updates its row rather than replacing it."""
+        # Arrange
+        initialize_database()
+        write_profile(make_profile("user.bsky.social"))
+        conn = get_connection()
+        (rowid,) = conn.execute(
+            "SELECT rowid FROM bluesky_profiles WHERE handle = ?",
+            ("user.bsky.social",),
+        ).fetchone()
+
+        # Act
+        write_profile(make_profile("user.bsky.social", bio="Updated"))
+
+        # Assert
+        row = conn.execute(
+            "SELECT rowid, bio FROM bluesky_profiles WHERE handle = ?",
+            ("user.bsky.social",),
+        ).fetchone()
+        assert tuple(row) == (rowid, "Updated")
+
+
+class TestBatchWritersWithEmptyInput:
+    """Tests for the empty-batch short-circuit in the batch writers."""
+
+    @pytest.mark.parametrize(
+        "writer",
+        [write_profiles, write_feed_posts, write_generated_bios, write_generated_feeds],
+    )
+    def test_returns_without_touching_the_database(self, writer):
+        """Test that an empty batch never opens a connection or transaction."""
+        # Arrange
+        with patch.object(db.db, "get_connection") as mock_get_conn:
+            # Act
+            writer([])
+
+            # Assert
+            mock_get_conn.assert_not_called()
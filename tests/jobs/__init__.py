@@ -0,0 +1 @@
+"""Tests for jobs modules."""
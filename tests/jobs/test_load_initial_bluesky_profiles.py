@@ -0,0 +1,105 @@
+"""Tests for jobs.load_initial_bluesky_profiles module."""
+
+import importlib
+import os
+import sqlite3
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+
+import db.db
+from db.db import close_connection, read_profile
+from db.repositories.feed_post_repository import FeedPostRepository
+
+# The job logs in to Bluesky at import time, so it is only importable where the
+# client library is installed; BlueskyClient itself is patched out below.
+pytest.importorskip("atproto")
+
+
+@pytest.fixture
+def job():
+    """Import the job module with the Bluesky client patched out."""
+    with patch("lib.bluesky_client.BlueskyClient"):
+        import jobs.load_initial_bluesky_profiles as module
+
+        yield importlib.reload(module)
+
+
+@pytest.fixture
+def temp_db_path():
+    """Point db.db.DB_PATH at a temporary database file for the test."""
+    original_path = db.db.DB_PATH
+
+    fd, temp_path = tempfile.mkstemp(suffix=".sqlite")
+    os.close(fd)
+    db.db.DB_PATH = temp_path
+
+    yield temp_path
+
+    close_connection()
+    db.db.DB_PATH = original_path
+    if os.path.exists(temp_path):
+        os.unlink(temp_path)
+
+
+def make_profile_info(handle: str) -> dict:
+    """Build raw Bluesky profile information for handle with one post."""
+    uri = f"at://did:plc:{handle}/app.bsky.feed.post/1"
+    return {
+        "profile": {
+            "handle": handle,
+            "did": f"did:plc:{handle}",
+            "display_name": "User",
+            "description": "Bio",
+            "followers_count": 1,
+            "follows_count": 1,
+            "posts_count": 1,
+        },
+        "author_feed": [
+            {
+                "uri": uri,
+                "author": {"display_name": "User", "handle": handle},
+                "record": {"text": "Post", "created_at": "2024-01-01T00:00:00Z"},
+                "bookmark_count": 0,
+                "like_count": 0,
+                "quote_count": 0,
+                "reply_count": 0,
+                "repost_count": 0,
+            }
+        ],
+    }
+
+
+class TestMain:
+    """Tests for main function."""
+
+    def test_failed_post_batch_does_not_write_profile(self, job, temp_db_path):
+        """Test that a profile is not persisted when writing its posts fails."""
+        # Arrange
+        handle = "user.bsky.social"
+        failing_feed_post_repo = Mock(spec=FeedPostRepository)
+        failing_feed_post_repo.create_or_update_feed_posts.side_effect = (
+            sqlite3.IntegrityError("post batch failed")
+        )
+
+        with (
+            patch.object(job, "BLUESKY_PROFILES", [handle]),
+            patch.object(
+                job,
+                "get_bsky_profile_information",
+                return_value=make_profile_info(handle),
+            ),
+            patch.object(
+                job,
+                "create_sqlite_feed_post_repository",
+                return_value=failing_feed_post_repo,
+            ),
+        ):
+            # Act
+            with pytest.raises(sqlite3.IntegrityError, match="post batch failed"):
+                job.main()
+
+        # Assert
+        failing_feed_post_repo.create_or_update_feed_posts.assert_called_once()
+        assert read_profile(handle) is None
@@ -11,10 +11,11 @@ from db.repositories.generated_feed_repository import GeneratedFeedRepository
 from db.repositories.profile_repository import ProfileRepository
 from db.repositories.run_repository import RunRepository
 from simulation.core.engine import SimulationEngine
+from simulation.core.models.actions import TurnAction
 from simulation.core.models.feeds import GeneratedFeed
 from simulation.core.models.posts import BlueskyFeedPost
 from simulation.core.models.runs import Run, RunStatus
-from simulation.core.models.turns import TurnData
+from simulation.core.models.turns import TurnData, TurnMetadata
 
 
 @pytest.fixture
@@ -282,6 +283,38 @@ class TestSimulationEngineListRuns:
         mock_repos["run_repo"].list_runs.assert_called_once()
 
 
+class TestSimulationEngineListTurnMetadata:
+    """Tests for SimulationEngine.list_turn_metadata method."""
+
+    def test_returns_turn_metadata_from_repository(self, engine, mock_repos):
+        """Test that list_turn_metadata delegates to the run repository."""
+        # Arrange
+        expected = [
+            TurnMetadata(
+                run_id="run_123",
+                turn_number=0,
+                total_actions={TurnAction.LIKE: 1},
+                created_at="2024_01_01-12:00:00",
+            )
+        ]
+        mock_repos["run_repo"].list_turn_metadata.return_value = expected
+
+        # Act
+        result = engine.list_turn_metadata("run_123")
+
+        # Assert
+        assert result == expected
+        mock_repos["run_repo"].list_turn_metadata.assert_called_once_with("run_123")
+
+    def test_raises_valueerror_for_empty_run_id(self, engine, mock_repos):
+        """Test that list_turn_metadata raises ValueError for an empty run_id."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="run_id cannot be empty"):
+            engine.list_turn_metadata("  ")
+
+        mock_repos["run_repo"].list_turn_metadata.assert_not_called()
+
+
 class TestSimulationEngineGetTurnData:
     """Tests for SimulationEngine.get_turn_data method."""
 